@@ -13,15 +13,29 @@ AI 토론 시스템
 """
 
 import json
+import re
+import shutil
 import sys
 from typing import Dict, List, Optional
 import time
 import subprocess
-import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
 
+# 파일명 키워드 정제용 정규식 (호출마다 패턴 조회하지 않도록 미리 컴파일)
+_SLUG_STRIP = re.compile(r'[^\w\-]')
+_SLUG_DASHES = re.compile(r'\-+')
+
+# 입장 레이블 이모지 (참여자 수가 더 많으면 순환)
+STANCE_EMOJIS = ("🔵", "🟡", "🟢", "🔴", "🟣", "🟠", "⚪", "⚫", "🟤", "🔷")
+
+# 콘솔 구분선
+_BANNER = "=" * 60
+_RULE = "-" * 60
+
+
 @dataclass
 class AIModel:
     """AI 모델 정보"""
@@ -65,6 +79,39 @@ AVAILABLE_AI_MODELS: Dict[str, AIModel] = {}
 # 캐시 파일 경로
 CACHE_FILE = Path(".ai_models_cache.json")
 
+# 같은 모델에 대한 연속 호출 최소 간격 (초)
+AI_CALL_INTERVAL = 1.0
+
+# 토론 발언 프롬프트 템플릿 (고정 문구는 모듈 로드 시 한 번만 생성)
+_DEBATE_PROMPT_TMPL = """당신은 다음 주제에 대한 {num_participants}명의 토론에 참여하고 있습니다:
+
+주제: {topic}
+
+당신의 이름과 입장: {stance_title} - {stance_position}
+
+다른 참여자들의 입장:
+{other_stances}
+
+토론 규칙:
+- 자신의 입장을 강력하게 방어하세요
+- 다른 참여자의 주장에 반박할 여지가 있다면 적극적으로 반박하세요
+- 상대의 논리적 오류, 근거 부족, 모순점, 과장, 일반화의 오류 등을 날카롭게 지적하세요
+- 논리적이고 구체적인 반론과 근거를 제시하세요
+- 감정적이거나 인신공격적인 표현은 피하되, 논리적으로는 강하게 반박하세요
+- 쉽게 동의하지 말고, 비판적 사고로 상대 주장을 면밀히 검토하세요
+- 타당한 지적만 수용하고, 반박 가능한 부분은 절대 놓치지 마세요
+- 상대 주장의 약점을 찾아내고, 대안이나 반례를 제시하세요
+
+**답변 길이 가이드:**
+- 충분히 상세하고 구체적으로 작성하세요
+- 하지만 {char_limit}자를 넘지 않도록 노력하세요
+- 너무 짧거나 추상적인 답변은 피하세요
+- 목표: {char_limit_quarter}-{char_limit}자 정도의 충실한 답변
+
+현재 지시사항: {instruction}
+
+한국어로 자연스럽게 답변해주세요."""
+
 
 def check_ai_model_availability(model_key: str, model: AIModel) -> bool:
     """
@@ -79,13 +126,17 @@ def check_ai_model_availability(model_key: str, model: AIModel) -> bool:
     """
     test_cmd = model.test_command or model.command[:1] + ["--version"]
 
+    # 실행 파일이 PATH에 없으면 프로세스를 띄우지 않고 바로 False
+    if shutil.which(test_cmd[0]) is None:
+        return False
+
     try:
+        # 종료 코드만 확인하므로 출력은 버림
         result = subprocess.run(
             test_cmd,
-            capture_output=True,
-            text=True,
-            timeout=1.0,
-            encoding='utf-8'
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=1.0
         )
         # 명령어가 실행되고 심각한 오류가 없으면 사용 가능
         return result.returncode in [0, 1]  # 일부 CLI는 --version이 없어 1 반환
@@ -105,13 +156,12 @@ def load_cached_models() -> Optional[List[str]]:
     Returns:
         캐시된 모델 키 리스트 또는 None (캐시 없음)
     """
-    if not CACHE_FILE.exists():
-        return None
-
     try:
-        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            return data.get('available_models', [])
+        # 존재 확인(stat) 없이 한 번에 읽고, 파일이 없으면 캐시 없음으로 처리
+        data = json.loads(CACHE_FILE.read_bytes())
+        return data.get('available_models', [])
+    except FileNotFoundError:
+        return None
     except Exception as e:
         print(f"⚠️  캐시 파일 읽기 실패: {e}")
         return None
@@ -129,8 +179,10 @@ def save_cached_models(available_keys: List[str]):
             'available_models': available_keys,
             'timestamp': time.strftime('%Y-%m-%d %H:%M:%S')
         }
-        with open(CACHE_FILE, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        CACHE_FILE.write_text(
+            json.dumps(data, ensure_ascii=False, indent=2),
+            encoding='utf-8'
+        )
     except Exception as e:
         print(f"⚠️  캐시 파일 저장 실패: {e}")
 
@@ -164,24 +216,32 @@ def initialize_available_models(force_refresh: bool = False):
                 print("⚠️  캐시된 모델이 유효하지 않습니다. 재확인합니다...\n")
 
     # AI 모델 가용성 확인
-    print("🔍 AI 모델 가용성 확인 중...")
-    print("-" * 60)
+    print("🔍 AI 모델 가용성 확인 중... (병렬 처리)")
+    print(_RULE)
 
     # 초기화 (이전 데이터 제거)
     AVAILABLE_AI_MODELS.clear()
     available_keys = []
 
+    # 모델별 확인은 서로 독립적이므로 병렬 처리 (전체 대기 시간 ≈ 가장 느린 1개)
+    with ThreadPoolExecutor(max_workers=len(ALL_AI_MODELS)) as executor:
+        futures = {
+            model_key: executor.submit(check_ai_model_availability, model_key, model)
+            for model_key, model in ALL_AI_MODELS.items()
+        }
+
+    # 출력과 등록은 정의 순서대로
     for model_key, model in ALL_AI_MODELS.items():
         print(f"  - {model.display_name}...", end=" ", flush=True)
 
-        if check_ai_model_availability(model_key, model):
+        if futures[model_key].result():
             AVAILABLE_AI_MODELS[model_key] = model
             available_keys.append(model_key)
             print("✅ 사용 가능")
         else:
             print("❌ 사용 불가")
 
-    print("-" * 60)
+    print(_RULE)
 
     # 사용 가능한 모델이 없으면 에러
     if not AVAILABLE_AI_MODELS:
@@ -226,6 +286,7 @@ class AIDebateSystem:
         self.char_limit = char_limit
         self.num_rounds = num_rounds
         self.timestamp = None  # 파일명에 사용할 타임스탬프
+        self._last_call: Dict[str, float] = {}  # 모델별 마지막 호출 완료 시각 (monotonic)
 
     def call_ai(self, prompt: str, ai_model: AIModel) -> str:
         """
@@ -238,6 +299,13 @@ class AIDebateSystem:
         Returns:
             AI 응답 텍스트
         """
+        # 같은 모델을 방금 호출했을 때만 남은 간격만큼 대기 (응답이 느리면 대기 없음)
+        last = self._last_call.get(ai_model.name)
+        if last is not None:
+            wait = AI_CALL_INTERVAL - (time.monotonic() - last)
+            if wait > 0:
+                time.sleep(wait)
+
         try:
             # AI CLI 호출 (stdin으로 프롬프트 전달)
             result = subprocess.run(
@@ -263,6 +331,8 @@ class AIDebateSystem:
             raise Exception(f"{ai_model.name} 응답 시간 초과 (5분)")
         except Exception as e:
             raise Exception(f"{ai_model.name} 호출 중 오류: {e}")
+        finally:
+            self._last_call[ai_model.name] = time.monotonic()
 
     def select_ai_for_stance(self, stance_title: str) -> AIModel:
         """
@@ -274,15 +344,19 @@ class AIDebateSystem:
         Returns:
             선택된 AI 모델
         """
-        print(f"\n{'='*60}")
-        print(f"🤖 {stance_title}의 AI 선택")
-        print(f"{'='*60}\n")
+        # 선택지가 하나뿐이면 묻지 않고 바로 사용
+        if len(AVAILABLE_AI_MODELS) == 1:
+            only_model = next(iter(AVAILABLE_AI_MODELS.values()))
+            print(f"✅ {stance_title}: {only_model.display_name} 자동 선택\n")
+            return only_model
 
-        models = list(AVAILABLE_AI_MODELS.keys())
-        for i, key in enumerate(models, 1):
-            model = AVAILABLE_AI_MODELS[key]
-            print(f"{i}. {model.display_name}")
+        print("\n" + _BANNER)
+        print(f"🤖 {stance_title}의 AI 선택")
+        print(_BANNER + "\n")
 
+        # 표시 순서대로 한 번만 나열해 두고 출력과 선택에 재사용
+        models = tuple(AVAILABLE_AI_MODELS.values())
+        print("\n".join(f"{i}. {model.display_name}" for i, model in enumerate(models, 1)))
         print()
 
         while True:
@@ -294,8 +368,7 @@ class AIDebateSystem:
 
                 choice_num = int(choice)
                 if 1 <= choice_num <= len(models):
-                    selected_key = models[choice_num - 1]
-                    selected_model = AVAILABLE_AI_MODELS[selected_key]
+                    selected_model = models[choice_num - 1]
                     print(f"✅ {selected_model.display_name} 선택됨\n")
                     return selected_model
                 else:
@@ -304,7 +377,7 @@ class AIDebateSystem:
                 print(f"❌ 올바른 숫자를 입력하세요.")
             except KeyboardInterrupt:
                 print("\n\n⚠️  기본값 사용")
-                return list(AVAILABLE_AI_MODELS.values())[0]
+                return models[0]
 
     def generate_filename_keyword(self, topic: str) -> str:
         """
@@ -335,12 +408,12 @@ class AIDebateSystem:
 
         try:
             # 파일명 생성은 첫 번째 사용 가능한 모델 사용
-            first_model = list(AVAILABLE_AI_MODELS.values())[0]
+            first_model = next(iter(AVAILABLE_AI_MODELS.values()))
             keyword = self.call_ai(prompt, first_model)
             # 안전하게 파일명으로 사용 가능하도록 정제
-            keyword = re.sub(r'[^\w\-]', '', keyword.lower().strip())
+            keyword = _SLUG_STRIP.sub('', keyword.lower().strip())
             # 연속된 하이픈 제거
-            keyword = re.sub(r'\-+', '-', keyword)
+            keyword = _SLUG_DASHES.sub('-', keyword)
             # 최대 50자로 제한
             return keyword[:50].strip('-')
         except Exception as e:
@@ -373,7 +446,7 @@ class AIDebateSystem:
 
         try:
             # 첫 번째 사용 가능한 모델로 제목 생성
-            first_model = list(AVAILABLE_AI_MODELS.values())[0]
+            first_model = next(iter(AVAILABLE_AI_MODELS.values()))
             title = self.call_ai(prompt, first_model)
             # 특수문자 제거 및 정리
             title = title.strip().strip('"\'')
@@ -393,12 +466,9 @@ class AIDebateSystem:
         Returns:
             토론 설정 정보 (주제, 입장들)
         """
-        print(f"\n{'='*60}")
+        print("\n" + _BANNER)
         print(f"📋 토론 주제: {topic}")
-        print(f"{'='*60}\n")
-
-        # 입장 레이블 정의 (이모지와 함께)
-        stance_emojis = ["🔵", "🟡", "🟢", "🔴", "🟣", "🟠", "⚪", "⚫", "🟤", "🔷"]
+        print(_BANNER + "\n")
 
         debate_setup = {
             'topic': topic,
@@ -410,9 +480,9 @@ class AIDebateSystem:
 
         # 각 참여자의 정보 입력받기
         for i in range(num_participants):
-            print(f"{'='*60}")
+            print(_BANNER)
             print(f"📍 참여자 {i+1}/{num_participants}")
-            print(f"{'='*60}\n")
+            print(_BANNER + "\n")
 
             # 참여자 입장 입력
             while True:
@@ -427,7 +497,7 @@ class AIDebateSystem:
             print(f"✅ 제목: {title}\n")
 
             # 입장 정보 저장
-            emoji = stance_emojis[i % len(stance_emojis)]
+            emoji = STANCE_EMOJIS[i % len(STANCE_EMOJIS)]
             stance = {
                 'title': title,
                 'position': position,
@@ -441,6 +511,17 @@ class AIDebateSystem:
             debate_setup['stances'].append(stance)
             print(f"✅ 참여자 {i+1} 설정 완료: {emoji} {title} ({ai_model.display_name})\n")
 
+        # 히스토리 출력용 라벨 표 (labels[보는 사람][발언자]) - 토론 중 재계산 방지
+        stances = debate_setup['stances']
+        debate_setup['labels'] = [
+            ["나" if s == v else stances[s]['title'] for s in range(num_participants)]
+            for v in range(num_participants)
+        ]
+        debate_setup['participant_labels'] = [
+            ["나" if s == v else f"참여자 {s+1}" for s in range(num_participants)]
+            for v in range(num_participants)
+        ]
+
         return debate_setup
 
     def check_consensus_ready(
@@ -469,9 +550,10 @@ class AIDebateSystem:
 
 지금까지의 토론 내용:
 """
-        for msg in history:
-            speaker_label = "나" if msg['speaker_idx'] == speaker_idx else f"참여자 {msg['speaker_idx']+1}"
-            prompt += f"{speaker_label}: {msg['content']}\n\n"
+        labels = debate_setup['participant_labels'][speaker_idx]
+        prompt += "".join(
+            f"{labels[msg['speaker_idx']]}: {msg['content']}\n\n" for msg in history
+        )
 
         prompt += f"""
 질문: 지금까지의 토론으로 최종 합의안을 도출할 준비가 되었나요?
@@ -532,45 +614,24 @@ class AIDebateSystem:
             if i != speaker_idx:
                 other_stances.append(f"{s['title']}: {s['position']}")
 
-        prompt = f"""당신은 다음 주제에 대한 {num_participants}명의 토론에 참여하고 있습니다:
-
-주제: {debate_setup['topic']}
-
-당신의 이름과 입장: {stance['title']} - {stance['position']}
-
-다른 참여자들의 입장:
-{chr(10).join(other_stances)}
-
-토론 규칙:
-- 자신의 입장을 강력하게 방어하세요
-- 다른 참여자의 주장에 반박할 여지가 있다면 적극적으로 반박하세요
-- 상대의 논리적 오류, 근거 부족, 모순점, 과장, 일반화의 오류 등을 날카롭게 지적하세요
-- 논리적이고 구체적인 반론과 근거를 제시하세요
-- 감정적이거나 인신공격적인 표현은 피하되, 논리적으로는 강하게 반박하세요
-- 쉽게 동의하지 말고, 비판적 사고로 상대 주장을 면밀히 검토하세요
-- 타당한 지적만 수용하고, 반박 가능한 부분은 절대 놓치지 마세요
-- 상대 주장의 약점을 찾아내고, 대안이나 반례를 제시하세요
-
-**답변 길이 가이드:**
-- 충분히 상세하고 구체적으로 작성하세요
-- 하지만 {self.char_limit}자를 넘지 않도록 노력하세요
-- 너무 짧거나 추상적인 답변은 피하세요
-- 목표: {self.char_limit // 4}-{self.char_limit}자 정도의 충실한 답변
-
-현재 지시사항: {instruction}
-
-한국어로 자연스럽게 답변해주세요."""
+        prompt = _DEBATE_PROMPT_TMPL.format(
+            num_participants=num_participants,
+            topic=debate_setup['topic'],
+            stance_title=stance['title'],
+            stance_position=stance['position'],
+            other_stances="\n".join(other_stances),
+            char_limit=self.char_limit,
+            char_limit_quarter=self.char_limit // 4,
+            instruction=instruction
+        )
 
         # 대화 히스토리 추가
         if history:
             prompt += "\n\n지금까지의 토론 내용:\n\n"
-            for msg in history:
-                if msg['speaker_idx'] == speaker_idx:
-                    speaker_label = "나"
-                else:
-                    other_stance = debate_setup['stances'][msg['speaker_idx']]
-                    speaker_label = other_stance['title']
-                prompt += f"{speaker_label}: {msg['content']}\n\n"
+            labels = debate_setup['labels'][speaker_idx]
+            prompt += "".join(
+                f"{labels[msg['speaker_idx']]}: {msg['content']}\n\n" for msg in history
+            )
 
         try:
             # 해당 입장의 AI 모델 사용
@@ -647,20 +708,26 @@ class AIDebateSystem:
         conversation_history = []
         actual_round_num = 0  # 실제 진행된 라운드 번호
         min_rounds = 2  # 최소 진행 라운드 (초기 주장 + 1회 토론)
+        # 발언자 표시 문자열은 토론 내내 같으므로 한 번만 생성
+        speaker_labels = [
+            f"{stance['emoji']} {stance['title']} ({stance['ai_model'].name})"
+            for stance in debate_setup['stances']
+        ]
         last_ready_status = None  # 이전 라운드의 합의 준비 상태
 
         for i, round_info in enumerate(rounds):
             actual_round_num = i + 1
 
-            print(f"\n{'='*60}")
+            print("\n" + _BANNER)
             print(f"📍 라운드 {actual_round_num}: {round_info['name']}")
-            print(f"{'='*60}\n")
+            print(_BANNER + "\n")
 
             # 발언 순서 결정: 합의 확인 후라면 반론 제기자 우선
             if last_ready_status is not None:
                 # 준비 안 된 참여자(반론 제기자) 먼저, 준비된 참여자 나중에
-                not_ready_indices = [idx for idx, ready in enumerate(last_ready_status) if not ready]
-                ready_indices = [idx for idx, ready in enumerate(last_ready_status) if ready]
+                not_ready_indices, ready_indices = [], []
+                for idx, ready in enumerate(last_ready_status):
+                    (ready_indices if ready else not_ready_indices).append(idx)
                 speaker_order = not_ready_indices + ready_indices
 
                 if not_ready_indices:
@@ -671,11 +738,9 @@ class AIDebateSystem:
 
             # 모든 참여자가 정해진 순서대로 발언
             for speaker_idx in speaker_order:
-                stance = debate_setup['stances'][speaker_idx]
-                ai_model = stance['ai_model']
-                emoji = stance['emoji']
+                speaker_label = speaker_labels[speaker_idx]
 
-                print(f"{emoji} {stance['title']} ({ai_model.name}) 발언 중...")
+                print(f"{speaker_label} 발언 중...")
                 response = self.get_ai_response(
                     debate_setup,
                     speaker_idx,
@@ -683,10 +748,10 @@ class AIDebateSystem:
                     round_info['instruction']
                 )
 
-                print(f"\n{emoji} {stance['title']} ({ai_model.name}):")
-                print(f"{'-'*60}")
+                print(f"\n{speaker_label}:")
+                print(_RULE)
                 print(response)
-                print(f"{'-'*60}\n")
+                print(_RULE + "\n")
 
                 conversation_history.append({
                     'speaker_idx': speaker_idx,
@@ -697,8 +762,6 @@ class AIDebateSystem:
                 # 실시간으로 파일에 저장
                 self.append_to_debate_file(debate_setup, speaker_idx, response, actual_round_num, round_info['name'])
 
-                time.sleep(1)  # API 호출 간격
-
             # 최종 합의안 라운드면 종료
             if round_info['name'] == '최종 합의안':
                 break
@@ -725,7 +788,6 @@ class AIDebateSystem:
                 if all(ready_status):
                     print("🎉 모든 참여자가 합의 준비를 완료했습니다!")
                     print("📝 최종 합의안 도출을 시작합니다.\n")
-                    time.sleep(1)
 
                     # 최종 합의안 라운드로 이동
                     actual_round_num += 1
@@ -734,17 +796,15 @@ class AIDebateSystem:
                         'instruction': f'최종 합의안을 간결하고 구체적으로 제안해주세요. ({self.char_limit}자 이내)',
                     }
 
-                    print(f"\n{'='*60}")
+                    print("\n" + _BANNER)
                     print(f"📍 라운드 {actual_round_num}: {final_round_info['name']}")
-                    print(f"{'='*60}\n")
+                    print(_BANNER + "\n")
 
                     # 모든 참여자가 최종 합의안 제시
                     for speaker_idx in range(num_participants):
-                        stance = debate_setup['stances'][speaker_idx]
-                        ai_model = stance['ai_model']
-                        emoji = stance['emoji']
+                        speaker_label = speaker_labels[speaker_idx]
 
-                        print(f"{emoji} {stance['title']} ({ai_model.name}) 발언 중...")
+                        print(f"{speaker_label} 발언 중...")
                         final_response = self.get_ai_response(
                             debate_setup,
                             speaker_idx,
@@ -752,10 +812,10 @@ class AIDebateSystem:
                             final_round_info['instruction']
                         )
 
-                        print(f"\n{emoji} {stance['title']} ({ai_model.name}):")
-                        print(f"{'-'*60}")
+                        print(f"\n{speaker_label}:")
+                        print(_RULE)
                         print(final_response)
-                        print(f"{'-'*60}\n")
+                        print(_RULE + "\n")
 
                         conversation_history.append({
                             'speaker_idx': speaker_idx,
@@ -764,7 +824,6 @@ class AIDebateSystem:
                         })
 
                         self.append_to_debate_file(debate_setup, speaker_idx, final_response, actual_round_num, final_round_info['name'])
-                        time.sleep(1)
 
                     break
                 else:
@@ -772,7 +831,6 @@ class AIDebateSystem:
                     last_ready_status = ready_status
                     print("➡️  토론을 계속 진행합니다.\n")
                     print(f"ℹ️  다음 라운드에서는 반론 제기자({sum(1 for r in ready_status if not r)}명)가 먼저 발언합니다.\n")
-                    time.sleep(1)
 
         # 토론 결과 저장
         self.conversation_history = conversation_history
@@ -780,10 +838,10 @@ class AIDebateSystem:
         # 최종 합의안 별도 파일로 저장 (실제 진행된 마지막 라운드 전달)
         self.save_conclusion_file(debate_setup, conversation_history, self.subject_slug, actual_round_num)
 
-        print(f"\n{'='*60}")
+        print("\n" + _BANNER)
         print(f"✅ 토론이 완료되었습니다! (총 {actual_round_num}라운드 진행)")
         print(f"📄 토론 전체 기록: {self.debate_filename}")
-        print(f"{'='*60}\n")
+        print(_BANNER + "\n")
 
     def initialize_debate_file(self, debate_setup: Dict):
         """
@@ -802,29 +860,32 @@ class AIDebateSystem:
 
         self.debate_filename = f"{self.subject_slug}-{self.timestamp}.md"
 
-        with open(self.debate_filename, 'w', encoding='utf-8') as f:
+        parts = [
             # 마크다운 헤더
-            f.write(f"# AI 토론 기록\n\n")
-            f.write(f"**생성 일시**: {time.strftime('%Y년 %m월 %d일 %H:%M:%S')}\n\n")
-            f.write(f"**참여자 수**: {len(debate_setup['stances'])}명\n\n")
-            f.write(f"---\n\n")
-
+            "# AI 토론 기록\n\n",
+            f"**생성 일시**: {time.strftime('%Y년 %m월 %d일 %H:%M:%S')}\n\n",
+            f"**참여자 수**: {len(debate_setup['stances'])}명\n\n",
+            "---\n\n",
             # 토론 주제 및 입장
-            f.write(f"## 📋 토론 주제\n\n")
-            f.write(f"{debate_setup['topic']}\n\n")
-
+            "## 📋 토론 주제\n\n",
+            f"{debate_setup['topic']}\n\n",
             # 모든 참여자의 입장 출력
-            f.write(f"## 👥 참여자 입장\n\n")
-            for i, stance in enumerate(debate_setup['stances']):
-                ai_model = stance['ai_model']
-                emoji = stance['emoji']
-                f.write(f"### {emoji} 참여자 {i+1}: {stance['title']} ({ai_model.display_name})\n\n")
-                f.write(f"> {stance['position']}\n\n")
+            "## 👥 참여자 입장\n\n",
+        ]
+        for i, stance in enumerate(debate_setup['stances']):
+            ai_model = stance['ai_model']
+            emoji = stance['emoji']
+            parts.append(f"### {emoji} 참여자 {i+1}: {stance['title']} ({ai_model.display_name})\n\n")
+            parts.append(f"> {stance['position']}\n\n")
 
-            f.write(f"---\n\n")
+        parts.append("---\n\n")
 
-            # 토론 내용 섹션 시작
-            f.write(f"## 💬 토론 내용\n\n")
+        # 토론 내용 섹션 시작
+        parts.append("## 💬 토론 내용\n\n")
+
+        # 헤더 전체를 한 번에 인코딩하여 기록
+        with open(self.debate_filename, 'wb') as f:
+            f.write("".join(parts).encode('utf-8'))
 
         print(f"💾 토론 기록 파일 생성: {self.debate_filename}\n")
 
@@ -864,11 +925,10 @@ class AIDebateSystem:
             통합된 최종 결론
         """
         # 각 참여자의 합의안 정리
-        proposals_text = ""
-        for msg in final_proposals:
-            speaker_idx = msg['speaker_idx']
-            stance = debate_setup['stances'][speaker_idx]
-            proposals_text += f"\n[{stance['title']}의 제안]\n{msg['content']}\n"
+        proposals_text = "".join(
+            f"\n[{debate_setup['stances'][msg['speaker_idx']]['title']}의 제안]\n{msg['content']}\n"
+            for msg in final_proposals
+        )
 
         prompt = f"""다음은 "{debate_setup['topic']}" 주제에 대한 {len(debate_setup['stances'])}명의 참여자들이 토론 후 제시한 최종 합의안입니다.
 
@@ -894,7 +954,7 @@ class AIDebateSystem:
 
         try:
             # 첫 번째 사용 가능한 모델로 통합 결론 생성
-            first_model = list(AVAILABLE_AI_MODELS.values())[0]
+            first_model = next(iter(AVAILABLE_AI_MODELS.values()))
             print("🤖 최종 합의안 종합 중...")
             unified_conclusion = self.call_ai(prompt, first_model)
             print("✅ 통합 결론 생성 완료\n")
@@ -913,8 +973,11 @@ class AIDebateSystem:
             subject_slug: 파일명에 사용할 주제 키워드
             final_round_num: 실제 진행된 마지막 라운드 번호
         """
-        # 마지막 라운드(최종 합의안) 내용만 추출
-        final_round = [msg for msg in history if msg['round'] == final_round_num]
+        # 마지막 라운드(최종 합의안) 내용만 추출 (라운드 순서로 쌓이므로 끝에서부터 확인)
+        start = len(history)
+        while start > 0 and history[start - 1]['round'] == final_round_num:
+            start -= 1
+        final_round = history[start:]
 
         if not final_round:
             print("⚠️  최종 합의안이 없어 conclusion 파일을 생성하지 않습니다.")
@@ -972,9 +1035,9 @@ class AIDebateSystem:
 
 def main():
     """메인 함수"""
-    print("\n" + "="*60)
+    print("\n" + _BANNER)
     print("🎯 AI 토론 시스템")
-    print("="*60)
+    print(_BANNER)
     print("\n여러 AI 모델을 사용하여 상반된 입장으로 토론하고 합의점을 찾습니다.")
     print("지원 모델: Claude, OpenAI, Gemini, Grok\n")
 
@@ -984,7 +1047,7 @@ def main():
 
         # 설정값 입력
         print("⚙️  토론 설정")
-        print("-" * 60)
+        print(_RULE)
 
         # 참여자 수 입력
         num_participants_input = input("토론 참여자 수 [기본: 2, 최소: 2, 최대: 10]: ").strip()
@@ -8,11 +8,23 @@ from ai_debate.config.constants import (
     MIN_PARTICIPANTS,
     MAX_PARTICIPANTS,
     MIN_ROUNDS,
+    FINAL_ROUND_NAME,
     CACHE_FILE,
+    MODEL_CACHE_TTL,
+    KEYWORD_CACHE_FILE,
+    RESPONSE_CACHE_FILE,
+    DEBATE_FILE_BUFFER_SIZE,
+    RESPONSE_CACHE_ENV,
     STANCE_EMOJIS,
     AI_CALL_TIMEOUT,
+    AI_CALL_INTERVAL,
+    AI_RETRY_ATTEMPTS,
+    AI_RETRY_BASE_DELAY,
     MODEL_CHECK_TIMEOUT,
+    WARMUP_PROMPT,
+    WARMUP_TIMEOUT,
     MIN_CHAR_RATIO,
+    EXPAND_SKIP_RATIO,
 )
 
 __all__ = [
@@ -23,9 +35,21 @@ __all__ = [
     "MIN_PARTICIPANTS",
     "MAX_PARTICIPANTS",
     "MIN_ROUNDS",
+    "FINAL_ROUND_NAME",
     "CACHE_FILE",
+    "MODEL_CACHE_TTL",
+    "KEYWORD_CACHE_FILE",
+    "RESPONSE_CACHE_FILE",
+    "DEBATE_FILE_BUFFER_SIZE",
+    "RESPONSE_CACHE_ENV",
     "STANCE_EMOJIS",
     "AI_CALL_TIMEOUT",
+    "AI_CALL_INTERVAL",
+    "AI_RETRY_ATTEMPTS",
+    "AI_RETRY_BASE_DELAY",
     "MODEL_CHECK_TIMEOUT",
+    "WARMUP_PROMPT",
+    "WARMUP_TIMEOUT",
     "MIN_CHAR_RATIO",
+    "EXPAND_SKIP_RATIO",
 ]
@@ -1,7 +1,7 @@
 """설정 상수 및 기본값"""
 
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Tuple
 from ai_debate.models.ai_model import AIModel
 
 
@@ -9,27 +9,27 @@ from ai_debate.models.ai_model import AIModel
 ALL_AI_MODELS: Dict[str, AIModel] = {
     "claude": AIModel(
         name="Claude",
-        command=["claude", "-p"],
+        command=("claude", "-p"),
         display_name="Claude (Anthropic)",
-        test_command=["claude", "--version"]
+        test_command=("claude", "--version")
     ),
     "openai": AIModel(
         name="OpenAI",
-        command=["codex", "exec", "--skip-git-repo-check"],
+        command=("codex", "exec", "--skip-git-repo-check"),
         display_name="OpenAI GPT (Codex)",
-        test_command=["codex", "--version"]
+        test_command=("codex", "--version")
     ),
     "gemini": AIModel(
         name="Gemini",
-        command=["gemini", "-p"],
+        command=("gemini", "-p"),
         display_name="Gemini (Google)",
-        test_command=["gemini", "--version"]
+        test_command=("gemini", "--version")
     ),
     "grok": AIModel(
         name="Grok",
-        command=["grok", "-p"],
+        command=("grok", "-p"),
         display_name="Grok (xAI)",
-        test_command=["grok", "--version"]
+        test_command=("grok", "--version")
     )
 }
 
@@ -41,18 +41,44 @@ MIN_PARTICIPANTS = 2
 MAX_PARTICIPANTS = 10
 MIN_ROUNDS = 2
 
+# 최종 합의안 라운드 이름
+FINAL_ROUND_NAME = '최종 합의안'
+
 # 파일 경로
 CACHE_FILE = Path(".ai_models_cache.json")
+KEYWORD_CACHE_FILE = Path(".ai_keyword_cache.json")
+RESPONSE_CACHE_FILE = Path.home() / ".ai_debate_cache.sqlite"
+
+# 토론 기록 파일 쓰기 버퍼 크기 (라운드 단위로 모아서 기록)
+DEBATE_FILE_BUFFER_SIZE = 1 << 16
+
+# 모델 가용성 캐시 유효 기간 (초)
+MODEL_CACHE_TTL = 24 * 60 * 60  # 24시간
+
+# 응답 캐시 활성화 환경 변수 (값이 "1"일 때만 사용)
+RESPONSE_CACHE_ENV = "AI_DEBATE_CACHE"
 
 # 입장 이모지
-STANCE_EMOJIS: List[str] = [
+STANCE_EMOJIS: Tuple[str, ...] = (
     "🔵", "🟡", "🟢", "🔴", "🟣",
     "🟠", "⚪", "⚫", "🟤", "🔷"
-]
+)
 
 # 타임아웃 설정 (초)
 AI_CALL_TIMEOUT = 300  # 5분
 MODEL_CHECK_TIMEOUT = 1.0  # 1초
 
+# 같은 모델에 대한 연속 호출 최소 간격 (초)
+AI_CALL_INTERVAL = 1.0
+
+# 일시적 오류 시 AI 호출 재시도 (지수 백오프 기준 대기 시간, 초)
+AI_RETRY_ATTEMPTS = 3
+AI_RETRY_BASE_DELAY = 1.0
+
+# 토론 전 CLI 예열용 프롬프트와 타임아웃 (초)
+WARMUP_PROMPT = "Reply with OK."
+WARMUP_TIMEOUT = 10.0
+
 # 글자 수 제한 비율
 MIN_CHAR_RATIO = 0.25  # 최소 글자 수 = char_limit * 0.25
+EXPAND_SKIP_RATIO = 0.85  # 최소 글자 수의 85% 이상이면 확장 재요청 생략
@@ -1,9 +1,15 @@
 """입출력 처리 패키지"""
 
 from ai_debate.io.cache_manager import CacheManager
+from ai_debate.io.debate_journal import DebateJournal
 from ai_debate.io.file_manager import FileManager
+from ai_debate.io.keyword_cache import KeywordCache
+from ai_debate.io.response_cache import ResponseCache
 
 __all__ = [
     "CacheManager",
+    "DebateJournal",
     "FileManager",
+    "KeywordCache",
+    "ResponseCache",
 ]
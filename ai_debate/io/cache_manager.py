@@ -1,8 +1,11 @@
 """캐시 관리 서비스"""
 
-import json
+import shutil
+import time
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Tuple
+from ai_debate.config.constants import ALL_AI_MODELS, MODEL_CACHE_TTL
+from ai_debate.io.json_io import read_json, write_json
 from ai_debate.exceptions import FileOperationError
 
 
@@ -11,32 +14,77 @@ class CacheManager:
 
     Attributes:
         cache_file: 캐시 파일 경로
+        ttl: 캐시 유효 기간 (초)
     """
 
-    def __init__(self, cache_file: Path = Path(".ai_models_cache.json")):
+    def __init__(
+        self,
+        cache_file: Path = Path(".ai_models_cache.json"),
+        ttl: float = MODEL_CACHE_TTL
+    ):
         """
         Args:
             cache_file: 캐시 파일 경로 (기본: .ai_models_cache.json)
+            ttl: 캐시 유효 기간 (초, 기본: 24시간)
         """
         self.cache_file = cache_file
+        self.ttl = ttl
 
-    def load_cached_models(self) -> Optional[List[str]]:
+    def load_cached_models(self) -> Tuple[Optional[List[str]], bool]:
         """캐시 파일에서 사용 가능한 모델 목록 로드
 
+        유효 기간이 지난 캐시도 목록은 반환하되 갱신 필요로 표시하여,
+        호출자가 우선 사용하면서 백그라운드에서 재확인할 수 있게 합니다.
+        캐시된 모델의 CLI가 제거되었거나 캐시 저장 이후 갱신되었으면
+        목록을 신뢰할 수 없으므로 None을 반환합니다.
+
         Returns:
-            캐시된 모델 키 리스트 또는 None (캐시 없음)
+            (캐시된 모델 키 리스트 또는 None, 유효 기간 내 여부)
         """
-        if not self.cache_file.exists():
-            return None
-
         try:
-            with open(self.cache_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return data.get('available_models', [])
+            data = read_json(self.cache_file)
+            cache_mtime = self.cache_file.stat().st_mtime
+        except FileNotFoundError:
+            return None, False
         except Exception as e:
             # 캐시 파일 읽기 실패 시 None 반환 (재확인 유도)
             print(f"⚠️  캐시 파일 읽기 실패: {e}")
-            return None
+            return None, False
+
+        available_keys = data.get('available_models', [])
+        if self._binaries_changed(available_keys, cache_mtime):
+            print("ℹ️  AI CLI 설치 상태가 바뀌어 다시 확인합니다.")
+            return None, False
+
+        # 이전 형식(cached_at)도 읽되, 저장은 ts/ttl 형식으로
+        saved_at = data.get('ts', data.get('cached_at', 0))
+        ttl = data.get('ttl', self.ttl)
+        return available_keys, time.time() - saved_at < ttl
+
+    @staticmethod
+    def _binaries_changed(model_keys: List[str], cache_mtime: float) -> bool:
+        """캐시된 모델의 CLI가 사라졌거나 캐시 이후 갱신되었는지 확인
+
+        Args:
+            model_keys: 캐시된 모델 키 리스트
+            cache_mtime: 캐시 파일 수정 시각
+
+        Returns:
+            하나라도 없거나 캐시보다 새로우면 True
+        """
+        for key in model_keys:
+            model = ALL_AI_MODELS.get(key)
+            if model is None:
+                continue
+            binary = shutil.which(model.command[0])
+            if binary is None:
+                return True
+            try:
+                if Path(binary).stat().st_mtime > cache_mtime:
+                    return True
+            except OSError:
+                return True
+        return False
 
     def save_cached_models(self, available_keys: List[str]) -> None:
         """사용 가능한 모델 목록을 캐시 파일에 저장
@@ -48,20 +96,18 @@ class CacheManager:
             FileOperationError: 캐시 저장 실패 시
         """
         try:
-            import time
             data = {
                 'available_models': available_keys,
-                'timestamp': time.strftime('%Y-%m-%d %H:%M:%S')
+                'ts': time.time(),
+                'ttl': self.ttl
             }
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            write_json(self.cache_file, data)
         except Exception as e:
             raise FileOperationError(f"캐시 파일 저장 실패: {e}")
 
     def clear_cache(self) -> None:
         """캐시 파일 삭제"""
-        if self.cache_file.exists():
-            try:
-                self.cache_file.unlink()
-            except Exception as e:
-                raise FileOperationError(f"캐시 파일 삭제 실패: {e}")
+        try:
+            self.cache_file.unlink(missing_ok=True)
+        except Exception as e:
+            raise FileOperationError(f"캐시 파일 삭제 실패: {e}")
@@ -0,0 +1,229 @@
+"""토론 진행 저널 (중단된 토론 이어하기용 JSONL 기록)"""
+
+import json
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Optional, Tuple
+from ai_debate.models.ai_model import AIModel
+from ai_debate.models.debate_setup import DebateSetup, Stance
+from ai_debate.exceptions import FileOperationError
+
+
+class DebateJournal:
+    """발언마다 한 줄씩 즉시 기록하는 JSONL 저널
+
+    첫 줄에는 토론 설정을, 이후 줄에는 발언을 기록합니다.
+    버퍼 없이 이어쓰기(O_APPEND) 모드로 열어 발언마다 write 한 번으로
+    디스크에 반영되므로, 프로세스가 비정상 종료되어도 마지막으로 완료된
+    발언까지는 보존됩니다. 토론이 정상적으로 끝나면 삭제합니다.
+
+    Attributes:
+        base_dir: 저널 파일을 저장할 디렉토리
+        current_file: 현재 기록 중인 저널 파일 경로
+    """
+
+    def __init__(self, base_dir: Path = Path(".")):
+        """
+        Args:
+            base_dir: 저널 파일 저장 디렉토리
+        """
+        self.base_dir = base_dir
+        self.current_file: Optional[Path] = None
+        self._fp: Optional[BinaryIO] = None
+
+    @staticmethod
+    def make_header(
+        debate_setup: DebateSetup,
+        subject_slug: str,
+        timestamp: str,
+        created_at: str
+    ) -> Dict:
+        """저널 첫 줄에 기록할 토론 설정 생성
+
+        Args:
+            debate_setup: 토론 설정
+            subject_slug: 파일명 키워드
+            timestamp: 토론 파일 타임스탬프
+            created_at: 토론 기록 파일에 표시한 생성 일시
+
+        Returns:
+            토론 설정 딕셔너리
+        """
+        return {
+            'topic': debate_setup.topic,
+            'char_limit': debate_setup.char_limit,
+            'num_rounds': debate_setup.num_rounds,
+            'subject_slug': subject_slug,
+            'timestamp': timestamp,
+            'created_at': created_at,
+            'stances': [
+                {
+                    'title': s.title,
+                    'position': s.position,
+                    'emoji': s.emoji,
+                    'model': s.ai_model.name,
+                    'agree_or_disagree': s.agree_or_disagree,
+                }
+                for s in debate_setup.stances
+            ],
+        }
+
+    @staticmethod
+    def build_setup(
+        header: Dict,
+        available_models: Dict[str, AIModel]
+    ) -> Optional[DebateSetup]:
+        """저널 설정으로 토론 설정 복원
+
+        Args:
+            header: 저널 첫 줄의 토론 설정
+            available_models: 현재 사용 가능한 AI 모델
+
+        Returns:
+            복원된 토론 설정 또는 None (필요한 AI 모델을 사용할 수 없을 때)
+        """
+        models_by_name = {m.name: m for m in available_models.values()}
+        stances = []
+        for s in header['stances']:
+            model = models_by_name.get(s['model'])
+            if model is None:
+                print(f"⚠️  {s['model']} 모델을 사용할 수 없어 이전 토론을 이어갈 수 없습니다.")
+                return None
+            stances.append(Stance(
+                title=s['title'],
+                position=s['position'],
+                emoji=s['emoji'],
+                ai_model=model,
+                agree_or_disagree=s.get('agree_or_disagree', "중립")
+            ))
+
+        return DebateSetup(
+            topic=header['topic'],
+            stances=stances,
+            char_limit=header['char_limit'],
+            num_rounds=header['num_rounds']
+        )
+
+    def find_latest(self, topic: str) -> Optional[Path]:
+        """같은 주제로 중단된 가장 최근 저널 찾기
+
+        Args:
+            topic: 토론 주제
+
+        Returns:
+            저널 파일 경로 또는 None
+        """
+        candidates = []
+        for path in self.base_dir.glob("*.jsonl"):
+            try:
+                with open(path, 'rb') as f:
+                    header = json.loads(f.readline())
+            except (OSError, ValueError):
+                continue
+            if isinstance(header, dict) and header.get('topic') == topic:
+                candidates.append(path)
+
+        if not candidates:
+            return None
+        return max(candidates, key=lambda p: p.stat().st_mtime)
+
+    @staticmethod
+    def load(path: Path) -> Tuple[Dict, List[Dict]]:
+        """저널 파일 읽기
+
+        비정상 종료로 마지막 줄이 잘려 있으면 그 줄은 무시합니다.
+
+        Args:
+            path: 저널 파일 경로
+
+        Returns:
+            (토론 설정, 발언 목록)
+
+        Raises:
+            FileOperationError: 읽기 실패 또는 설정 줄이 손상된 경우
+        """
+        try:
+            lines = path.read_bytes().splitlines()
+            header = json.loads(lines[0])
+        except (OSError, ValueError, IndexError) as e:
+            raise FileOperationError(f"토론 저널 읽기 실패: {e}")
+
+        messages = []
+        for line in lines[1:]:
+            try:
+                messages.append(json.loads(line))
+            except ValueError:
+                break
+
+        return header, messages
+
+    def start(
+        self,
+        path: Path,
+        header: Dict,
+        messages: Optional[List[Dict]] = None
+    ) -> None:
+        """저널 파일을 새로 작성하고 이어쓰기용으로 열어 둠
+
+        Args:
+            path: 저널 파일 경로
+            header: 토론 설정
+            messages: 미리 기록할 발언 목록 (이어하기 시 보존할 발언)
+
+        Raises:
+            FileOperationError: 파일 생성 실패 시
+        """
+        self.close()
+        lines = [self._encode(header)]
+        lines.extend(self._encode(msg) for msg in messages or [])
+
+        try:
+            path.write_bytes(b"".join(lines))
+            # 버퍼 없이 O_APPEND로 열어 발언마다 write 한 번으로 기록
+            self._fp = open(path, 'ab', buffering=0)
+            self.current_file = path
+        except Exception as e:
+            raise FileOperationError(f"토론 저널 생성 실패: {e}")
+
+    def append(self, message: Dict) -> None:
+        """발언 한 줄 기록
+
+        Args:
+            message: 발언 정보
+
+        Raises:
+            FileOperationError: 파일 쓰기 실패 시
+        """
+        if self._fp is None:
+            return
+        try:
+            self._fp.write(self._encode(message))
+        except Exception as e:
+            raise FileOperationError(f"토론 저널 쓰기 실패: {e}")
+
+    def close(self) -> None:
+        """저널 파일 핸들 닫기 (파일은 남겨 둠)"""
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
+
+    def discard(self) -> None:
+        """토론이 정상 종료되었을 때 저널 파일 삭제"""
+        self.close()
+        if self.current_file is not None:
+            try:
+                self.current_file.unlink()
+            except OSError:
+                pass
+            self.current_file = None
+
+    @staticmethod
+    def _encode(record: Dict) -> bytes:
+        """JSONL 한 줄로 인코딩 (내부 메서드)
+
+        Args:
+            record: 기록할 딕셔너리
+
+        Returns:
+            줄바꿈을 포함한 UTF-8 바이트
+        """
+        return (json.dumps(record, ensure_ascii=False) + "\n").encode('utf-8')
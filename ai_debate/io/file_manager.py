@@ -1,20 +1,36 @@
 """파일 관리 서비스"""
 
+import os
 import time
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import BinaryIO, Dict, List, Optional, Tuple
+from ai_debate.models.ai_model import AIModel
 from ai_debate.models.debate_setup import DebateSetup
+from ai_debate.models.turn import Turn
+from ai_debate.io.debate_journal import DebateJournal
+from ai_debate.config.constants import DEBATE_FILE_BUFFER_SIZE, FINAL_ROUND_NAME
 from ai_debate.exceptions import FileOperationError
 
+# 참여자 입장 블록 템플릿 (토론 기록/합의안 파일 공통)
+_PARTICIPANT_HDR = "### {emoji} 참여자 {n}: {title} ({display})\n\n"
+_PARTICIPANT_QUOTE = "> {position}\n\n"
+
+# 파일명 타임스탬프와 기록 파일의 생성 일시 표기 형식
+_TIMESTAMP_FORMAT = "%Y%m%d-%H%M%S"
+_CREATED_AT_FORMAT = "%Y년 %m월 %d일 %H:%M:%S"
+
 
 class FileManager:
     """마크다운 파일 생성 및 관리
 
+    with 문으로 사용하면 블록을 벗어날 때 토론 기록 파일을 닫습니다.
+
     Attributes:
         base_dir: 파일을 저장할 기본 디렉토리
         current_debate_file: 현재 토론 파일 경로
         current_round: 현재 라운드 번호
         timestamp: 파일명에 사용할 타임스탬프
+        journal: 중단된 토론 이어하기용 발언 저널
     """
 
     def __init__(self, base_dir: Path = Path(".")):
@@ -26,6 +42,19 @@ class FileManager:
         self.current_debate_file: Optional[Path] = None
         self.current_round: int = 0
         self.timestamp: Optional[str] = None
+        # 토론 동안 열어 두는 기록 파일 핸들 (발언마다 재오픈 방지)
+        self._debate_fp: Optional[BinaryIO] = None
+        # 기록 파일 헤더에 쓴 참여자 입장 블록 (합의안 파일에서 재사용)
+        self._participants_cache: Optional[Tuple[DebateSetup, str]] = None
+        self.journal = DebateJournal(base_dir)
+
+    def __enter__(self) -> "FileManager":
+        """with 문 진입 (자기 자신 반환)"""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """with 문 종료 시 토론 기록 파일과 저널 핸들 닫기 (예외는 전파)"""
+        self.close_debate_file()
 
     def initialize_debate_file(
         self,
@@ -44,41 +73,265 @@ class FileManager:
         Raises:
             FileOperationError: 파일 생성 실패 시
         """
-        # 타임스탬프 생성 및 저장
-        self.timestamp = time.strftime("%Y%m%d-%H%M%S")
+        # 타임스탬프 생성 및 저장 (생성 일시는 이어하기 때 그대로 쓰도록 저널에도 기록)
+        now = time.localtime()
+        self.timestamp = time.strftime(_TIMESTAMP_FORMAT, now)
+        created_at = time.strftime(_CREATED_AT_FORMAT, now)
 
         filename = f"{subject_slug}-{self.timestamp}.md"
         filepath = self.base_dir / filename
         self.current_debate_file = filepath
+        self.current_round = 0
+        self.close_debate_file()
 
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                # 마크다운 헤더
-                f.write("# AI 토론 기록\n\n")
-                f.write(f"**생성 일시**: {time.strftime('%Y년 %m월 %d일 %H:%M:%S')}\n\n")
-                f.write(f"**참여자 수**: {len(debate_setup.stances)}명\n\n")
-                f.write("---\n\n")
+            # 바이너리 모드로 열어 두고 한 번에 인코딩하여 기록
+            f = open(filepath, 'wb', buffering=DEBATE_FILE_BUFFER_SIZE)
+            self._debate_fp = f
+            f.write(self._header_text(
+                debate_setup, self._participants_block(debate_setup), created_at
+            ).encode('utf-8'))
+            f.flush()
+
+            self.journal.start(
+                self.base_dir / f"{subject_slug}-{self.timestamp}.jsonl",
+                DebateJournal.make_header(
+                    debate_setup, subject_slug, self.timestamp, created_at
+                )
+            )
 
-                # 토론 주제 및 입장
-                f.write("## 📋 토론 주제\n\n")
-                f.write(f"{debate_setup.topic}\n\n")
+            print(f"💾 토론 기록 파일 생성: {filename}\n")
+            return filepath
 
-                # 모든 참여자의 입장 출력
-                f.write("## 👥 참여자 입장\n\n")
-                for i, stance in enumerate(debate_setup.stances):
-                    f.write(f"### {stance.emoji} 참여자 {i+1}: {stance.title} ({stance.ai_model.display_name})\n\n")
-                    f.write(f"> {stance.position}\n\n")
+        except Exception as e:
+            self.close_debate_file()
+            raise FileOperationError(f"토론 파일 생성 실패: {e}")
 
-                f.write("---\n\n")
+    def find_interrupted_debate(
+        self,
+        topic: str,
+        available_models: Dict[str, AIModel]
+    ) -> Optional[Tuple[Path, DebateSetup, str]]:
+        """같은 주제로 중단된 토론 찾기
 
-                # 토론 내용 섹션 시작
-                f.write("## 💬 토론 내용\n\n")
+        Args:
+            topic: 토론 주제
+            available_models: 현재 사용 가능한 AI 모델
 
-            print(f"💾 토론 기록 파일 생성: {filename}\n")
-            return filepath
+        Returns:
+            (저널 경로, 토론 설정, 파일명 키워드) 또는 None (없거나 복원 불가)
+        """
+        journal_path = self.journal.find_latest(topic)
+        if journal_path is None:
+            return None
+
+        try:
+            header, _ = DebateJournal.load(journal_path)
+        except FileOperationError as e:
+            print(f"⚠️  {e}")
+            return None
+
+        try:
+            debate_setup = DebateJournal.build_setup(header, available_models)
+            if debate_setup is None:
+                return None
+            return journal_path, debate_setup, header['subject_slug']
+        except (KeyError, TypeError) as e:
+            # 같은 주제의 다른 JSONL 파일이거나 손상된 저널이면 새 토론으로 진행
+            print(f"⚠️  저널 형식이 올바르지 않아 이어갈 수 없습니다 ({journal_path.name}): {e!r}")
+            return None
+
+    def resume_debate_file(
+        self,
+        debate_setup: DebateSetup,
+        journal_path: Path
+    ) -> Tuple[List[Turn], bool]:
+        """중단된 토론의 기록 파일을 저널로부터 다시 작성하고 이어쓰기 준비
+
+        모든 참여자가 발언을 마친 라운드까지만 이어가고,
+        중간에 끊긴 라운드의 발언은 버린 뒤 그 라운드부터 다시 진행합니다.
+
+        Args:
+            debate_setup: 저널에서 복원한 토론 설정
+            journal_path: 저널 파일 경로
+
+        Returns:
+            (보존된 대화 히스토리, 최종 합의안 라운드까지 끝났는지 여부)
+
+        Raises:
+            FileOperationError: 파일 읽기/쓰기 실패 시
+        """
+        header, messages = DebateJournal.load(journal_path)
+
+        # 라운드별 발언 수를 세어 완료된 라운드의 발언만 보존
+        num_participants = len(debate_setup.stances)
+        counts: Dict[int, int] = {}
+        for msg in messages:
+            counts[msg['round']] = counts.get(msg['round'], 0) + 1
+        kept = [msg for msg in messages if counts[msg['round']] == num_participants]
+
+        self.timestamp = header['timestamp']
+        filename = f"{header['subject_slug']}-{self.timestamp}.md"
+        self.current_debate_file = self.base_dir / filename
+        self.current_round = 0
+        self.close_debate_file()
+
+        # 생성 일시는 처음 토론을 시작한 시각을 유지
+        # (생성 일시를 기록하지 않던 이전 저널은 파일명 타임스탬프에서 복원)
+        created_at = header.get('created_at') or time.strftime(
+            _CREATED_AT_FORMAT, time.strptime(self.timestamp, _TIMESTAMP_FORMAT)
+        )
+
+        # 헤더와 보존된 발언으로 기록 파일을 다시 작성 (버퍼에 남아 유실된 발언 복구)
+        parts = [self._header_text(
+            debate_setup, self._participants_block(debate_setup), created_at
+        )]
+        for msg in kept:
+            parts.append(self._turn_text(
+                debate_setup,
+                msg['speaker_idx'],
+                msg['content'],
+                msg['round'],
+                msg['round_name']
+            ))
 
+        try:
+            f = open(self.current_debate_file, 'wb', buffering=DEBATE_FILE_BUFFER_SIZE)
+            self._debate_fp = f
+            f.write("".join(parts).encode('utf-8'))
+            f.flush()
+            self.journal.start(journal_path, header, kept)
         except Exception as e:
-            raise FileOperationError(f"토론 파일 생성 실패: {e}")
+            self.close_debate_file()
+            raise FileOperationError(f"토론 파일 복구 실패: {e}")
+
+        print(f"💾 토론 기록 파일 이어쓰기: {filename}\n")
+
+        history = [Turn(m['speaker_idx'], m['content'], m['round']) for m in kept]
+        finished = bool(kept) and kept[-1]['round_name'] == FINAL_ROUND_NAME
+        return history, finished
+
+    def discard_journal(self) -> None:
+        """토론이 정상적으로 끝난 뒤 저널 파일 삭제"""
+        self.journal.discard()
+
+    def discard_interrupted_debate(self, journal_path: Path) -> None:
+        """이어가지 않기로 한 중단된 토론의 저널 삭제
+
+        남겨 두면 같은 주제로 실행할 때마다 같은 토론을 이어갈지 다시 묻게 됩니다.
+        토론 기록 파일(.md)은 그대로 둡니다.
+
+        Args:
+            journal_path: 저널 파일 경로
+        """
+        try:
+            journal_path.unlink(missing_ok=True)
+            print(f"🗑️  중단된 토론의 저널을 삭제했습니다: {journal_path.name}")
+        except OSError as e:
+            print(f"⚠️  저널 삭제 실패: {e}")
+
+    @staticmethod
+    def _header_text(
+        debate_setup: DebateSetup,
+        participants: str,
+        created_at: str
+    ) -> str:
+        """토론 기록 파일 헤더 생성 (내부 메서드)
+
+        Args:
+            debate_setup: 토론 설정 정보
+            participants: 참여자 입장 블록
+            created_at: 표시할 생성 일시
+
+        Returns:
+            마크다운 헤더 텍스트
+        """
+        parts = [
+            "# AI 토론 기록\n\n",
+            f"**생성 일시**: {created_at}\n\n",
+            f"**참여자 수**: {len(debate_setup.stances)}명\n\n",
+            "---\n\n",
+            # 토론 주제 및 입장
+            "## 📋 토론 주제\n\n",
+            f"{debate_setup.topic}\n\n",
+            # 모든 참여자의 입장 출력
+            "## 👥 참여자 입장\n\n",
+        ]
+        parts.append(participants)
+        parts.append("---\n\n")
+
+        # 토론 내용 섹션 시작
+        parts.append("## 💬 토론 내용\n\n")
+        return "".join(parts)
+
+    def _participants_block(self, debate_setup: DebateSetup) -> str:
+        """참여자 입장 블록 반환 (같은 토론 설정이면 기록 파일에 쓴 것을 재사용, 내부 메서드)
+
+        Args:
+            debate_setup: 토론 설정 정보
+
+        Returns:
+            참여자 입장 마크다운 텍스트
+        """
+        cached = self._participants_cache
+        if cached is not None and cached[0] is debate_setup:
+            return cached[1]
+
+        block = self._participants_text(debate_setup)
+        self._participants_cache = (debate_setup, block)
+        return block
+
+    @staticmethod
+    def _participants_text(debate_setup: DebateSetup) -> str:
+        """참여자 입장 블록 생성 (내부 메서드)
+
+        Args:
+            debate_setup: 토론 설정 정보
+
+        Returns:
+            모든 참여자의 제목과 입장을 담은 마크다운 텍스트
+        """
+        return "".join(
+            _PARTICIPANT_HDR.format(
+                emoji=stance.emoji,
+                n=i,
+                title=stance.title,
+                display=stance.ai_model.display_name
+            ) + _PARTICIPANT_QUOTE.format(position=stance.position)
+            for i, stance in enumerate(debate_setup.stances, 1)
+        )
+
+    def _turn_text(
+        self,
+        debate_setup: DebateSetup,
+        speaker_idx: int,
+        content: str,
+        round_num: int,
+        round_name: str
+    ) -> str:
+        """발언 하나의 마크다운 생성 (새 라운드면 라운드 헤더 포함, 내부 메서드)
+
+        Args:
+            debate_setup: 토론 설정 정보
+            speaker_idx: 참여자 인덱스
+            content: 발언 내용
+            round_num: 라운드 번호
+            round_name: 라운드 이름
+
+        Returns:
+            마크다운 텍스트
+        """
+        parts = []
+
+        # 새 라운드 시작 시 라운드 헤더 추가
+        if round_num != self.current_round:
+            self.current_round = round_num
+            parts.append(f"### 라운드 {round_num}: {round_name}\n\n")
+
+        stance = debate_setup.stances[speaker_idx]
+        parts.append(f"#### {stance.emoji} {stance.title} ({stance.ai_model.name})\n\n")
+        parts.append(f"{content}\n\n")
+        return "".join(parts)
 
     def append_to_debate_file(
         self,
@@ -104,26 +357,60 @@ class FileManager:
             raise FileOperationError("토론 파일이 초기화되지 않았습니다")
 
         try:
-            with open(self.current_debate_file, 'a', encoding='utf-8') as f:
-                # 새 라운드 시작 시 라운드 헤더 추가
-                if round_num != self.current_round:
-                    self.current_round = round_num
-                    f.write(f"### 라운드 {round_num}: {round_name}\n\n")
+            # 핸들이 닫힌 뒤 호출되면 이어쓰기 모드로 다시 연다
+            if self._debate_fp is None or self._debate_fp.closed:
+                self._debate_fp = open(
+                    self.current_debate_file, 'ab', buffering=DEBATE_FILE_BUFFER_SIZE
+                )
+            f = self._debate_fp
+
+            # 새 라운드 시작 시 이전 라운드 내용을 디스크로 내보냄
+            if round_num != self.current_round:
+                f.flush()
 
-                stance = debate_setup.stances[speaker_idx]
-                f.write(f"#### {stance.emoji} {stance.title} ({stance.ai_model.name})\n\n")
-                f.write(f"{content}\n\n")
+            # 발언 단위로 버퍼에 기록 (flush는 라운드 경계와 파일 닫을 때만)
+            text = self._turn_text(debate_setup, speaker_idx, content, round_num, round_name)
+            f.write(text.encode('utf-8'))
 
         except Exception as e:
             raise FileOperationError(f"토론 파일 쓰기 실패: {e}")
 
+        # 버퍼 없는 저널에는 즉시 기록 (비정상 종료 시 이어하기용)
+        self.journal.append({
+            'speaker_idx': speaker_idx,
+            'content': content,
+            'round': round_num,
+            'round_name': round_name
+        })
+
+    def flush_debate_file(self) -> None:
+        """버퍼에 쌓인 토론 기록을 파일에 반영
+
+        Raises:
+            FileOperationError: 파일 쓰기 실패 시
+        """
+        if self._debate_fp is not None and not self._debate_fp.closed:
+            try:
+                self._debate_fp.flush()
+            except Exception as e:
+                raise FileOperationError(f"토론 파일 쓰기 실패: {e}")
+
+    def close_debate_file(self) -> None:
+        """열려 있는 토론 기록 파일과 저널 핸들 닫기"""
+        if self._debate_fp is not None:
+            if not self._debate_fp.closed:
+                self._debate_fp.close()
+            self._debate_fp = None
+        self.journal.close()
+
     def save_conclusion_file(
         self,
         debate_setup: DebateSetup,
-        history: List[Dict],
+        history: List[Turn],
         subject_slug: str,
         final_round_num: int,
-        unified_conclusion: str
+        unified_conclusion: str,
+        final_round: Optional[List[Turn]] = None
     ) -> Path:
         """최종 합의안을 별도 파일로 저장
 
@@ -133,6 +420,7 @@ class FileManager:
             subject_slug: 파일명에 사용할 주제 키워드
             final_round_num: 실제 진행된 마지막 라운드 번호
             unified_conclusion: 통합된 최종 결론
+            final_round: 최종 라운드 발언 목록 (None이면 히스토리에서 추출)
 
         Returns:
             생성된 결론 파일 경로
@@ -140,8 +428,15 @@ class FileManager:
         Raises:
             FileOperationError: 파일 생성 실패 시
         """
-        # 마지막 라운드(최종 합의안) 내용만 추출
-        final_round = [msg for msg in history if msg.get('round') == final_round_num]
+        # 마지막 라운드(최종 합의안) 내용만 추출 (호출자가 넘긴 목록이 맞지 않으면 다시 추출)
+        if final_round is None or any(
+            msg.round != final_round_num for msg in final_round
+        ):
+            # 히스토리는 라운드 순서로 쌓이므로 끝에서부터 최종 라운드 구간만 확인
+            start = len(history)
+            while start > 0 and history[start - 1].round == final_round_num:
+                start -= 1
+            final_round = history[start:]
 
         if not final_round:
             print("⚠️  최종 합의안이 없어 conclusion 파일을 생성하지 않습니다.")
@@ -149,48 +444,58 @@ class FileManager:
 
         # 토론 파일과 동일한 타임스탬프 사용
         if not self.timestamp:
-            self.timestamp = time.strftime("%Y%m%d-%H%M%S")
+            self.timestamp = time.strftime(_TIMESTAMP_FORMAT)
 
         filename = f"{subject_slug}-conclusion-{self.timestamp}.md"
         filepath = self.base_dir / filename
 
+        # 마크다운 헤더
+        parts = [
+            "# 토론 합의안\n\n",
+            f"**생성 일시**: {time.strftime(_CREATED_AT_FORMAT)}\n\n",
+            f"**참여자 수**: {len(debate_setup.stances)}명\n\n",
+            "---\n\n",
+            # 토론 주제
+            "## 📋 토론 주제\n\n",
+            f"{debate_setup.topic}\n\n",
+            "---\n\n",
+            # 모든 참여자 입장
+            "## 👥 참여자 입장\n\n",
+        ]
+        parts.append(self._participants_block(debate_setup))
+        parts.append("---\n\n")
+
+        # 통합된 최종 결론
+        parts.append("## 📝 통합 최종 결론\n\n")
+        parts.append(f"{unified_conclusion}\n\n")
+        parts.append("---\n\n")
+
+        # 개별 참여자 합의안 (참고용)
+        parts.append("## 📌 개별 참여자 합의안 (참고)\n\n")
+
+        for msg in final_round:
+            stance = debate_setup.stances[msg.speaker_idx]
+            parts.append(f"### {stance.emoji} {stance.title} ({stance.ai_model.name})의 제안\n\n")
+            parts.append(f"{msg.content}\n\n")
+
+        data = "".join(parts).encode('utf-8')
+        tmp_path = self.base_dir / f".{filename}.tmp"
+
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                # 마크다운 헤더
-                f.write("# 토론 합의안\n\n")
-                f.write(f"**생성 일시**: {time.strftime('%Y년 %m월 %d일 %H:%M:%S')}\n\n")
-                f.write(f"**참여자 수**: {len(debate_setup.stances)}명\n\n")
-                f.write("---\n\n")
-
-                # 토론 주제
-                f.write("## 📋 토론 주제\n\n")
-                f.write(f"{debate_setup.topic}\n\n")
-                f.write("---\n\n")
-
-                # 모든 참여자 입장
-                f.write("## 👥 참여자 입장\n\n")
-                for i, stance in enumerate(debate_setup.stances):
-                    f.write(f"### {stance.emoji} 참여자 {i+1}: {stance.title} ({stance.ai_model.display_name})\n\n")
-                    f.write(f"> {stance.position}\n\n")
-
-                f.write("---\n\n")
-
-                # 통합된 최종 결론
-                f.write("## 📝 통합 최종 결론\n\n")
-                f.write(f"{unified_conclusion}\n\n")
-                f.write("---\n\n")
-
-                # 개별 참여자 합의안 (참고용)
-                f.write("## 📌 개별 참여자 합의안 (참고)\n\n")
-
-                for msg in final_round:
-                    speaker_idx = msg['speaker_idx']
-                    stance = debate_setup.stances[speaker_idx]
-                    f.write(f"### {stance.emoji} {stance.title} ({stance.ai_model.name})의 제안\n\n")
-                    f.write(f"{msg['content']}\n\n")
+            # 임시 파일에 한 번에 기록한 뒤 교체 (중단되어도 잘린 결론 파일이 남지 않음)
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, filepath)
 
             print(f"📄 합의안 파일 저장: {filename}")
             return filepath
 
-        except Exception as e:
+        except BaseException as e:
+            # 중단(KeyboardInterrupt 포함) 시 임시 파일 정리
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            if not isinstance(e, Exception):
+                raise
             raise FileOperationError(f"결론 파일 생성 실패: {e}")
@@ -0,0 +1,69 @@
+"""캐시 파일용 JSON 읽기/쓰기
+
+orjson이 설치되어 있으면 사용하고, 없으면 표준 라이브러리 json으로 동작합니다.
+두 경우 모두 UTF-8 그대로(ensure_ascii=False), 공백 없는 압축 형식으로 기록합니다.
+"""
+
+import os
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성
+    orjson = None
+    import json
+
+
+def read_json(path: Path) -> Any:
+    """JSON 파일을 한 번에 읽어 파싱
+
+    Args:
+        path: 읽을 파일 경로
+
+    Returns:
+        파싱된 데이터
+
+    Raises:
+        OSError: 파일 읽기 실패 시
+        ValueError: JSON 형식 오류 시
+    """
+    raw = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def write_json(path: Path, data: Any) -> None:
+    """데이터를 JSON으로 직렬화하여 원자적으로 기록
+
+    같은 디렉토리의 임시 파일에 기록하고 fsync한 뒤 os.replace로 교체하므로,
+    기록 중 중단되어도 기존 파일이 잘린 상태로 남지 않습니다.
+
+    Args:
+        path: 기록할 파일 경로
+        data: 직렬화할 데이터
+
+    Raises:
+        OSError: 파일 쓰기 실패 시
+        TypeError: 직렬화할 수 없는 데이터일 때
+    """
+    if orjson is not None:
+        raw = orjson.dumps(data)
+    else:
+        raw = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    tmp_path = path.with_name(path.name + '.tmp')
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(raw)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        # 실패/중단 시 임시 파일 정리
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,136 @@
+"""파일명 키워드 및 참여자 제목 캐시 관리"""
+
+import hashlib
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+from ai_debate.config.constants import KEYWORD_CACHE_FILE
+from ai_debate.io.json_io import read_json, write_json
+
+
+class KeywordCache:
+    """AI가 생성한 파일명 키워드와 참여자 제목의 디스크 캐시
+
+    같은 주제(또는 같은 주제와 핵심 주장)로 다시 실행하면
+    AI를 호출하지 않고 저장된 결과를 사용합니다.
+    캐시 파일은 처음 조회할 때 한 번만 읽고 이후에는 메모리에서 조회합니다.
+
+    Attributes:
+        cache_file: 캐시 파일 경로
+    """
+
+    def __init__(self, cache_file: Path = KEYWORD_CACHE_FILE):
+        """
+        Args:
+            cache_file: 캐시 파일 경로 (기본: .ai_keyword_cache.json)
+        """
+        self.cache_file = cache_file
+        self._entries: Optional[Dict[str, Dict]] = None
+        # 제목을 병렬로 생성할 때 로드/저장이 겹치지 않도록 직렬화
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """캐시 키 생성
+
+        Args:
+            *parts: 키를 구성할 문자열 (주제, 핵심 주장 등)
+
+        Returns:
+            sha256 다이제스트 앞 16자리
+        """
+        return hashlib.sha256("|".join(parts).encode('utf-8')).hexdigest()[:16]
+
+    def get_keyword(self, topic: str) -> Optional[str]:
+        """캐시된 파일명 키워드 조회
+
+        Args:
+            topic: 토론 주제
+
+        Returns:
+            캐시된 키워드 또는 None (캐시 없음)
+        """
+        return self._get('keyword:' + self.make_key(topic), 'keyword')
+
+    def set_keyword(self, topic: str, keyword: str) -> None:
+        """파일명 키워드 저장
+
+        Args:
+            topic: 토론 주제
+            keyword: 정제된 파일명 키워드
+        """
+        self._set('keyword:' + self.make_key(topic), {'keyword': keyword})
+
+    def get_title(self, topic: str, position: str) -> Optional[str]:
+        """캐시된 참여자 제목 조회
+
+        Args:
+            topic: 토론 주제
+            position: 핵심 주장 또는 역할
+
+        Returns:
+            캐시된 제목 또는 None (캐시 없음)
+        """
+        return self._get('title:' + self.make_key(topic, position), 'title')
+
+    def set_title(self, topic: str, position: str, title: str) -> None:
+        """참여자 제목 저장
+
+        Args:
+            topic: 토론 주제
+            position: 핵심 주장 또는 역할
+            title: 생성된 제목
+        """
+        self._set('title:' + self.make_key(topic, position), {'title': title})
+
+    def _get(self, key: str, field: str) -> Optional[str]:
+        """캐시 항목의 특정 필드 조회 (내부 메서드)
+
+        Args:
+            key: 캐시 키
+            field: 조회할 필드 이름
+
+        Returns:
+            필드 값 또는 None
+        """
+        entry = self._load().get(key)
+        return entry.get(field) if entry else None
+
+    def _set(self, key: str, value: Dict) -> None:
+        """캐시 항목 저장 후 파일에 기록 (내부 메서드)
+
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+        """
+        with self._lock:
+            entries = self._load()
+            entries[key] = {**value, 'ts': time.time()}
+
+            try:
+                write_json(self.cache_file, entries)
+            except Exception as e:
+                # 결과는 이미 사용 가능하므로 저장 실패는 경고만 출력
+                print(f"⚠️  키워드 캐시 저장 실패: {e}")
+
+    def _load(self) -> Dict[str, Dict]:
+        """캐시 파일 로드 (최초 호출 시 한 번만 읽음)
+
+        Returns:
+            캐시 항목 딕셔너리
+        """
+        with self._lock:
+            if self._entries is None:
+                self._entries = {}
+                try:
+                    data = read_json(self.cache_file)
+                    if isinstance(data, dict):
+                        self._entries = data
+                except FileNotFoundError:
+                    # 캐시 파일이 아직 없으면 빈 캐시로 시작
+                    pass
+                except Exception as e:
+                    # 읽기 실패 시 빈 캐시로 시작 (AI 호출로 진행)
+                    print(f"⚠️  키워드 캐시 읽기 실패: {e}")
+            return self._entries
@@ -0,0 +1,128 @@
+"""AI 응답 캐시 관리"""
+
+import threading
+import time
+from pathlib import Path
+from typing import Optional, TYPE_CHECKING
+from ai_debate.models.ai_model import AIModel
+from ai_debate.config.constants import RESPONSE_CACHE_FILE
+
+if TYPE_CHECKING:
+    import sqlite3
+
+
+class ResponseCache:
+    """(모델, 프롬프트) 단위 AI 응답 영구 캐시
+
+    같은 모델에 동일한 프롬프트를 다시 보내면 CLI를 호출하지 않고
+    저장된 응답을 반환합니다. 데이터베이스는 첫 사용 시점에 연결합니다.
+
+    Attributes:
+        cache_file: SQLite 캐시 파일 경로
+    """
+
+    def __init__(self, cache_file: Path = RESPONSE_CACHE_FILE):
+        """
+        Args:
+            cache_file: 캐시 파일 경로 (기본: ~/.ai_debate_cache.sqlite)
+        """
+        self.cache_file = cache_file
+        self._conn: Optional["sqlite3.Connection"] = None
+        # 병렬 AI 호출에서 하나의 연결을 공유하므로 직렬화
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(prompt_bytes: bytes, ai_model: AIModel) -> bytes:
+        """캐시 키 생성
+
+        Args:
+            prompt_bytes: UTF-8로 인코딩된 프롬프트
+            ai_model: 사용할 AI 모델 정보
+
+        Returns:
+            blake2b(모델 이름 + NUL + 프롬프트) 16바이트 다이제스트
+        """
+        import hashlib
+
+        digest = hashlib.blake2b(ai_model.name.encode('utf-8'), digest_size=16)
+        digest.update(b'\x00')
+        digest.update(prompt_bytes)
+        return digest.digest()
+
+    def get(self, prompt_bytes: bytes, ai_model: AIModel) -> Optional[str]:
+        """캐시된 응답 조회
+
+        Args:
+            prompt_bytes: UTF-8로 인코딩된 프롬프트
+            ai_model: 사용할 AI 모델 정보
+
+        Returns:
+            캐시된 응답 텍스트 또는 None (캐시 없음)
+        """
+        import sqlite3
+
+        key = self.make_key(prompt_bytes, ai_model)
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT response FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            # 캐시 조회 실패 시 None 반환 (CLI 호출로 진행)
+            print(f"⚠️  응답 캐시 읽기 실패: {e}")
+            return None
+        return row[0] if row else None
+
+    def set(self, prompt_bytes: bytes, ai_model: AIModel, response: str) -> None:
+        """응답을 캐시에 저장
+
+        Args:
+            prompt_bytes: UTF-8로 인코딩된 프롬프트
+            ai_model: 사용한 AI 모델 정보
+            response: AI 응답 텍스트
+        """
+        import sqlite3
+
+        key = self.make_key(prompt_bytes, ai_model)
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, response, ts) VALUES (?, ?, ?)",
+                    (key, response, time.time())
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            # 이미 받은 응답은 유효하므로 저장 실패는 경고만 출력
+            print(f"⚠️  응답 캐시 저장 실패: {e}")
+
+    def close(self) -> None:
+        """데이터베이스 연결 종료"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _connect(self) -> "sqlite3.Connection":
+        """데이터베이스 연결 (최초 호출 시 생성)
+
+        Returns:
+            SQLite 연결 객체
+        """
+        if self._conn is None:
+            # 캐시를 켠 경우에만 필요하므로 첫 연결 시점에 import
+            import sqlite3
+
+            self._conn = sqlite3.connect(
+                str(self.cache_file),
+                check_same_thread=False
+            )
+            # 병렬 호출 중 읽기가 쓰기에 막히지 않도록 WAL 모드 사용
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key BLOB PRIMARY KEY, response TEXT, ts REAL)"
+            )
+            # 이전 형식(sha256 키) 테이블은 더 이상 조회되지 않으므로 정리
+            self._conn.execute("DROP TABLE IF EXISTS cache")
+        return self._conn
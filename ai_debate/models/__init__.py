@@ -2,5 +2,6 @@
 
 from ai_debate.models.ai_model import AIModel
 from ai_debate.models.debate_setup import Stance, DebateSetup
+from ai_debate.models.turn import Turn
 
-__all__ = ["AIModel", "Stance", "DebateSetup"]
+__all__ = ["AIModel", "Stance", "DebateSetup", "Turn"]
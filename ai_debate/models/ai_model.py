@@ -1,20 +1,32 @@
 """AI 모델 데이터 클래스"""
 
+import shlex
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Optional, Tuple
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AIModel:
     """AI 모델 정보를 저장하는 데이터 클래스
 
+    불변 객체이므로 해시 가능하며 딕셔너리 키로 사용할 수 있습니다.
+
     Attributes:
         name: 간단한 모델 이름 (예: "Claude")
-        command: CLI 명령어 리스트 (예: ["claude", "-p"])
+        command: CLI 명령어 튜플 (예: ("claude", "-p"))
         display_name: 화면 표시용 전체 이름 (예: "Claude (Anthropic)")
-        test_command: 가용성 테스트용 명령어 (예: ["claude", "--version"])
+        test_command: 가용성 테스트용 명령어 (예: ("claude", "--version"))
     """
     name: str
-    command: List[str]
+    command: Tuple[str, ...]
     display_name: str
-    test_command: Optional[List[str]] = None
+    test_command: Optional[Tuple[str, ...]] = None
+
+    @property
+    def command_line(self) -> str:
+        """셸에 그대로 붙여 넣을 수 있는 명령어 문자열 (오류 메시지용)
+
+        Returns:
+            인자별로 필요한 곳만 따옴표 처리한 명령어
+        """
+        return shlex.join(self.command)
@@ -0,0 +1,16 @@
+"""토론 발언 데이터 클래스"""
+
+from typing import NamedTuple
+
+
+class Turn(NamedTuple):
+    """대화 히스토리에 쌓이는 발언 하나
+
+    Attributes:
+        speaker_idx: 발언자 인덱스 (debate_setup.stances 기준)
+        content: 발언 내용
+        round: 라운드 번호 (1부터 시작)
+    """
+    speaker_idx: int
+    content: str
+    round: int
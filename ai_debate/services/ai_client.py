@@ -1,27 +1,93 @@
 """AI CLI 호출 서비스"""
 
+import codecs
+import random
 import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 from ai_debate.models.ai_model import AIModel
-from ai_debate.config.constants import AI_CALL_TIMEOUT
+from ai_debate.io.response_cache import ResponseCache
+from ai_debate.config.constants import (
+    AI_CALL_TIMEOUT,
+    AI_CALL_INTERVAL,
+    AI_RETRY_ATTEMPTS,
+    AI_RETRY_BASE_DELAY,
+)
 from ai_debate.exceptions import AIResponseError, AITimeoutError, AIModelNotFoundError
 
 
 class AIClient:
-    """AI CLI를 통한 AI 모델 호출 서비스"""
+    """AI CLI를 통한 AI 모델 호출 서비스
 
-    def __init__(self, timeout: int = AI_CALL_TIMEOUT):
+    Attributes:
+        timeout: AI 호출 타임아웃 (초)
+        response_cache: 응답 캐시 (None이면 캐시 미사용)
+        min_interval: 같은 모델에 대한 연속 호출 최소 간격 (초)
+    """
+
+    def __init__(
+        self,
+        timeout: int = AI_CALL_TIMEOUT,
+        response_cache: Optional[ResponseCache] = None,
+        min_interval: float = AI_CALL_INTERVAL
+    ):
         """
         Args:
             timeout: AI 호출 타임아웃 (초)
+            response_cache: 응답 캐시 (기본: 사용 안 함)
+            min_interval: 같은 모델에 대한 연속 호출 최소 간격 (초)
         """
         self.timeout = timeout
+        self.response_cache = response_cache
+        self.min_interval = min_interval
+        # 모델별 마지막 호출 완료 시각 (time.monotonic 기준)
+        self._last_call: Dict[str, float] = {}
+        self._last_call_lock = threading.Lock()
 
-    def call_ai(self, prompt: str, ai_model: AIModel) -> str:
+    def call_ai(
+        self,
+        prompt: str,
+        ai_model: AIModel,
+        stream: bool = False
+    ) -> str:
         """AI CLI를 호출하여 응답 받기
 
+        응답 캐시가 설정되어 있으면 동일한 (모델, 프롬프트)에 대해
+        CLI를 다시 호출하지 않고 캐시된 응답을 반환합니다.
+
         Args:
             prompt: AI에게 전달할 프롬프트
             ai_model: 사용할 AI 모델 정보
+            stream: True면 응답을 받는 대로 터미널에 출력
+
+        Returns:
+            AI의 응답 텍스트
+
+        Raises:
+            AIModelNotFoundError: AI CLI를 찾을 수 없음
+            AITimeoutError: 응답 타임아웃
+            AIResponseError: 기타 AI 응답 오류
+        """
+        return self.call_ai_bytes(prompt.encode('utf-8'), ai_model, stream)
+
+    def call_ai_bytes(
+        self,
+        prompt_bytes: bytes,
+        ai_model: AIModel,
+        stream: bool = False
+    ) -> str:
+        """이미 UTF-8로 인코딩된 프롬프트로 AI CLI 호출
+
+        미리 인코딩해 둔 조각을 이어 붙인 프롬프트를 다시 인코딩하지 않고
+        그대로 CLI 표준 입력으로 전달합니다.
+
+        Args:
+            prompt_bytes: UTF-8로 인코딩된 프롬프트
+            ai_model: 사용할 AI 모델 정보
+            stream: True면 응답을 받는 대로 터미널에 출력
 
         Returns:
             AI의 응답 텍스트
@@ -30,24 +96,142 @@ class AIClient:
             AIModelNotFoundError: AI CLI를 찾을 수 없음
             AITimeoutError: 응답 타임아웃
             AIResponseError: 기타 AI 응답 오류
+            KeyboardInterrupt: CLI가 시그널로 종료됨 (사용자의 Ctrl+C 등)
         """
+        if self.response_cache is not None:
+            cached = self.response_cache.get(prompt_bytes, ai_model)
+            if cached is not None:
+                if stream:
+                    print(cached)
+                return cached
+
+        self._wait_for_interval(ai_model)
         try:
-            result = subprocess.run(
-                ai_model.command,
-                input=prompt,
-                capture_output=True,
-                text=True,
-                timeout=self.timeout,
-                encoding='utf-8'
-            )
+            response = self._run_cli(prompt_bytes, ai_model, stream)
+        finally:
+            with self._last_call_lock:
+                self._last_call[ai_model.name] = time.monotonic()
+
+        if self.response_cache is not None:
+            self.response_cache.set(prompt_bytes, ai_model, response)
+
+        return response
+
+    def call_many(
+        self,
+        requests: Sequence[Tuple[Union[str, bytes], AIModel]],
+        return_exceptions: bool = False
+    ) -> List[Union[str, Exception]]:
+        """서로 의존하지 않는 여러 AI 호출을 동시에 실행
+
+        CLI 호출은 프로세스 대기 시간이 대부분이므로 스레드로 병렬 실행하면
+        전체 소요 시간이 가장 느린 호출 하나 수준으로 줄어듭니다.
+        각 호출은 call_ai_with_retry로 실행되어 일시적 오류 시 개별적으로 재시도합니다.
+
+        Args:
+            requests: (프롬프트, AI 모델) 목록 (프롬프트는 str 또는 UTF-8 bytes)
+            return_exceptions: True면 실패한 호출의 예외를 결과 자리에 담아 반환
+
+        Returns:
+            요청 순서대로의 응답 목록
+
+        Raises:
+            AIModelNotFoundError, AIResponseError:
+                return_exceptions가 False일 때 첫 번째로 실패한 호출의 예외
+        """
+        if not requests:
+            return []
+
+        def call(request: Tuple[Union[str, bytes], AIModel]) -> str:
+            prompt, ai_model = request
+            return self.call_ai_with_retry(prompt, ai_model)
+
+        with ThreadPoolExecutor(max_workers=len(requests)) as executor:
+            futures = [executor.submit(call, request) for request in requests]
+
+        results: List[Union[str, Exception]] = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                results.append(e)
+        return results
+
+    def _wait_for_interval(self, ai_model: AIModel) -> None:
+        """같은 모델의 직전 호출 이후 최소 간격이 지나지 않았으면 남은 시간만 대기
+
+        CLI 응답 자체가 보통 간격보다 오래 걸리므로 대부분 대기 없이 통과합니다.
+
+        Args:
+            ai_model: 호출할 AI 모델 정보
+        """
+        with self._last_call_lock:
+            last = self._last_call.get(ai_model.name)
+        if last is None:
+            return
+
+        wait = self.min_interval - (time.monotonic() - last)
+        if wait > 0:
+            time.sleep(wait)
 
-            if result.returncode != 0:
-                error_msg = result.stderr.strip() if result.stderr else "알 수 없는 오류"
+    def _run_cli(
+        self,
+        prompt_bytes: bytes,
+        ai_model: AIModel,
+        stream: bool = False
+    ) -> str:
+        """AI CLI 프로세스를 실행하여 응답 받기 (내부 메서드)
+
+        Args:
+            prompt_bytes: UTF-8로 인코딩된 프롬프트
+            ai_model: 사용할 AI 모델 정보
+            stream: True면 응답을 받는 대로 터미널에 출력
+
+        Returns:
+            AI의 응답 텍스트
+
+        Raises:
+            AIModelNotFoundError: AI CLI를 찾을 수 없음
+            AITimeoutError: 응답 타임아웃
+            AIResponseError: 기타 AI 응답 오류
+            KeyboardInterrupt: CLI가 시그널로 종료됨 (사용자의 Ctrl+C 등)
+        """
+        try:
+            if stream:
+                returncode, stdout, stderr = self._communicate_streaming(
+                    prompt_bytes, ai_model
+                )
+            else:
+                # 바이트로 주고받고 마지막에 한 번만 디코딩 (텍스트 래퍼 생략)
+                result = subprocess.run(
+                    ai_model.command,
+                    input=prompt_bytes,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    timeout=self.timeout
+                )
+                returncode, stdout, stderr = result.returncode, result.stdout, result.stderr
+
+            if returncode < 0:
+                # 시그널로 종료된 경우(보통 Ctrl+C)는 오류가 아니라 중단으로 처리해
+                # 재시도하지 않고 호출한 쪽까지 바로 전파
+                raise KeyboardInterrupt(
+                    f"{ai_model.name} CLI가 시그널 {-returncode}로 종료되었습니다"
+                )
+
+            if returncode != 0:
+                # stderr는 오류가 났을 때만 디코딩
+                error_msg = (
+                    stderr.decode('utf-8', errors='replace').strip()
+                    if stderr else ""
+                ) or "알 수 없는 오류"
                 raise AIResponseError(
-                    f"{ai_model.name} 응답 오류 (코드 {result.returncode}): {error_msg}"
+                    f"{ai_model.name} 응답 오류 (코드 {returncode}): {error_msg}"
                 )
 
-            response = result.stdout.strip()
+            response = stdout.decode('utf-8', errors='replace').strip()
 
             if not response:
                 raise AIResponseError(f"{ai_model.name}로부터 빈 응답을 받았습니다")
@@ -57,7 +241,7 @@ class AIClient:
         except FileNotFoundError:
             raise AIModelNotFoundError(
                 f"{ai_model.name} CLI를 찾을 수 없습니다. "
-                f"명령어: {' '.join(ai_model.command)}"
+                f"명령어: {ai_model.command_line}"
             )
         except subprocess.TimeoutExpired:
             raise AITimeoutError(
@@ -69,44 +253,138 @@ class AIClient:
         except Exception as e:
             raise AIResponseError(f"{ai_model.name} 호출 중 예외 발생: {e}")
 
+    def _communicate_streaming(
+        self,
+        prompt_bytes: bytes,
+        ai_model: AIModel
+    ) -> Tuple[int, bytes, bytes]:
+        """AI CLI를 실행하고 표준 출력을 줄 단위로 터미널에 바로 출력 (내부 메서드)
+
+        Args:
+            prompt_bytes: UTF-8로 인코딩된 프롬프트
+            ai_model: 사용할 AI 모델 정보
+
+        Returns:
+            (종료 코드, 전체 표준 출력, 전체 표준 오류)
+
+        Raises:
+            FileNotFoundError: CLI 실행 파일 없음
+            subprocess.TimeoutExpired: 타임아웃 초과 (프로세스는 종료됨)
+        """
+        proc = subprocess.Popen(
+            ai_model.command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+
+        def feed_stdin() -> None:
+            try:
+                proc.stdin.write(prompt_bytes)
+                proc.stdin.close()
+            except (BrokenPipeError, OSError):
+                pass
+
+        stderr_chunks = []
+        timed_out = threading.Event()
+
+        def kill_on_timeout() -> None:
+            timed_out.set()
+            proc.kill()
+
+        # 표준 입력 쓰기와 표준 오류 읽기는 별도 스레드 (파이프 교착 방지)
+        writer = threading.Thread(target=feed_stdin, daemon=True)
+        err_reader = threading.Thread(
+            target=lambda: stderr_chunks.append(proc.stderr.read()),
+            daemon=True
+        )
+        timer = threading.Timer(self.timeout, kill_on_timeout)
+        writer.start()
+        err_reader.start()
+        timer.start()
+
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        stdout_chunks = []
+        try:
+            for line in proc.stdout:
+                stdout_chunks.append(line)
+                sys.stdout.write(decoder.decode(line))
+                sys.stdout.flush()
+            sys.stdout.write(decoder.decode(b'', final=True))
+            proc.wait()
+        finally:
+            timer.cancel()
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            writer.join()
+            err_reader.join()
+            proc.stdout.close()
+            proc.stderr.close()
+
+        if stdout_chunks and not stdout_chunks[-1].endswith(b'\n'):
+            print()
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(ai_model.command, self.timeout)
+
+        return proc.returncode, b"".join(stdout_chunks), b"".join(stderr_chunks)
+
     def call_ai_with_retry(
         self,
-        prompt: str,
+        prompt: Union[str, bytes],
         ai_model: AIModel,
-        max_retries: int = 3
+        max_retries: int = AI_RETRY_ATTEMPTS,
+        stream: bool = False,
+        base_delay: float = AI_RETRY_BASE_DELAY
     ) -> str:
         """재시도 로직을 포함한 AI 호출
 
+        일시적인 오류(속도 제한, 네트워크 끊김 등)에 대비해 실패하면
+        base_delay * 2^시도횟수에 무작위 지연을 더한 만큼 기다린 뒤 다시 호출합니다.
+        CLI 미설치와 사용자 중단(KeyboardInterrupt)은 재시도하지 않습니다.
+        스트리밍 중 재시도하면 앞서 출력된 부분 응답과 구분되도록 구분 문구를 먼저 출력합니다.
+
         Args:
-            prompt: AI에게 전달할 프롬프트
+            prompt: AI에게 전달할 프롬프트 (str 또는 UTF-8 bytes)
             ai_model: 사용할 AI 모델 정보
-            max_retries: 최대 재시도 횟수
+            max_retries: 최대 시도 횟수
+            stream: True면 응답을 받는 대로 터미널에 출력
+            base_delay: 백오프 기준 대기 시간 (초)
 
         Returns:
             AI의 응답 텍스트
 
         Raises:
+            AIModelNotFoundError: AI CLI를 찾을 수 없음 (재시도하지 않음)
             AIResponseError: 모든 재시도 실패 시
+            KeyboardInterrupt: CLI가 시그널로 종료됨 (재시도하지 않음)
         """
+        if isinstance(prompt, str):
+            prompt = prompt.encode('utf-8')
         last_exception = None
 
         for attempt in range(max_retries):
+            if stream and attempt > 0:
+                print(f"\n🔁 재시도 {attempt + 1}/{max_retries}: 위의 부분 응답은 버리고 새 응답을 출력합니다")
             try:
-                return self.call_ai(prompt, ai_model)
+                return self.call_ai_bytes(prompt, ai_model, stream)
             except AITimeoutError as e:
                 last_exception = e
                 if attempt < max_retries - 1:
                     print(f"⚠️  타임아웃 발생, 재시도 중... ({attempt + 1}/{max_retries})")
-                    continue
             except AIResponseError as e:
                 last_exception = e
                 if attempt < max_retries - 1:
                     print(f"⚠️  오류 발생, 재시도 중... ({attempt + 1}/{max_retries})")
-                    continue
             except AIModelNotFoundError:
                 # CLI가 없는 경우는 재시도해도 소용없음
                 raise
 
+            if attempt < max_retries - 1:
+                # 지수 백오프 + 지터 (동시에 실패한 호출들이 한꺼번에 재시도하지 않도록)
+                time.sleep(base_delay * 2 ** attempt + random.uniform(0, base_delay))
+
         # 모든 재시도 실패
         raise AIResponseError(
             f"AI 호출 실패 (총 {max_retries}회 시도): {last_exception}"
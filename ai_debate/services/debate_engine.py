@@ -1,14 +1,57 @@
 """토론 진행 엔진"""
 
-import time
-from typing import List, Dict, Tuple
+import json
+import re
+from itertools import islice
+from pathlib import Path
+from typing import List, Dict, Tuple, Iterator, Optional
+from concurrent.futures import ThreadPoolExecutor
+from ai_debate.models.ai_model import AIModel
 from ai_debate.models.debate_setup import DebateSetup
+from ai_debate.models.turn import Turn
 from ai_debate.services.ai_client import AIClient
 from ai_debate.services.prompt_generator import PromptGenerator
 from ai_debate.io.file_manager import FileManager
-from ai_debate.config.constants import MIN_CHAR_RATIO
+from ai_debate.config.constants import (
+    EXPAND_SKIP_RATIO,
+    FINAL_ROUND_NAME,
+    MIN_CHAR_RATIO,
+)
 from ai_debate.exceptions import AIResponseError
 
+# 합의 준비 휴리스틱용 표현 (발언에 합의 표현이 충분하면 AI 확인 생략)
+# (토론 지시문이 합의점 탐색을 요구하므로 "합의"·"수용" 같은 단어만으로는 판단하지 않음)
+_CONSENSUS_MARKERS = frozenset(['합의합니다', '동의합니다', '수용합니다', '받아들입니다'])
+_DISAGREE_MARKERS = frozenset(['반대', '수 없', '불가능', '않', '잘못'])
+_MIN_CONSENSUS_MARKERS = 2
+
+# 합의 준비 확인 응답 판정 (YES/NO 단답을 요청하므로 맨 앞 단어로 결정)
+_READY_TOKEN_RE = re.compile(r'\W*(YES|NO)(?![A-Za-z])', re.IGNORECASE)
+# YES/NO 없이 한국어로 답한 경우: 앞부분에 "준비 (가) 완료/됐/되었"이 있고 부정 표현이 없어야 준비 완료
+_READY_KO_RE = re.compile(r'준비\s*(?:가|는)?\s*(?:완료|됐|되었|됨)')
+_NOT_READY_RE = re.compile(r'않|안\s|안[되됐]|못|아직|없')
+_READY_ANSWER_SCAN = 64
+
+# 콘솔 구분선
+_BANNER = "=" * 60
+_RULE = "-" * 60
+
+# 짧은 답변 확장 요청 프롬프트 (고정 부분은 미리 인코딩)
+_EXPAND_PREFIX = "다음 답변이 ".encode('utf-8')
+_EXPAND_MID = "자로 너무 짧습니다.\n\n원본 답변:\n".encode('utf-8')
+_EXPAND_SUFFIX = """
+
+**더 상세하게 작성해주세요:**
+- 구체적인 근거와 예시를 추가하세요
+- 논점을 더 명확하게 설명하세요
+- 목표: %d-%d자 정도
+- 하지만 %d자는 넘지 마세요
+
+상세한 답변만 출력하세요 (다른 설명 없이).""".encode('utf-8')
+
+# AI 응답 생성에 실패했을 때 발언 대신 기록하는 문구
+_FALLBACK_RESPONSE = "응답 생성 중 오류가 발생했습니다."
+
 
 class DebateEngine:
     """토론 진행 핵심 엔진
@@ -17,182 +60,240 @@ class DebateEngine:
         ai_client: AI 호출 클라이언트
         prompt_generator: 프롬프트 생성기
         file_manager: 파일 관리자
+        stream_output: 순차 발언을 생성되는 대로 터미널에 출력할지 여부
     """
 
     def __init__(
         self,
         ai_client: AIClient,
         prompt_generator: PromptGenerator,
-        file_manager: FileManager
+        file_manager: FileManager,
+        stream_output: bool = True
     ):
         """
         Args:
             ai_client: AI 호출 클라이언트
             prompt_generator: 프롬프트 생성기
             file_manager: 파일 관리자
+            stream_output: 순차 발언 스트리밍 출력 여부 (기본: True)
         """
         self.ai_client = ai_client
         self.prompt_generator = prompt_generator
         self.file_manager = file_manager
+        self.stream_output = stream_output
+        # 앞 라운드 요약 (요약된 메시지는 프롬프트에 원문 대신 요약으로 전달)
+        self._history_summary: str = ""
+        self._summary_cutoff: int = 0
+        # 참여자별 마지막 발언 (히스토리가 늘어난 만큼만 갱신)
+        self._latest_turns: Dict[int, str] = {}
+        self._latest_turns_end: int = 0
+        # 참여자별 고정 머리말 (토론 시작 시 한 번만 생성)
+        self._preamble_setup: Optional[DebateSetup] = None
+        self._debate_preambles: List[str] = []
+        self._consensus_preambles: List[str] = []
 
     def conduct_debate(
         self,
         debate_setup: DebateSetup,
-        subject_slug: str
-    ) -> List[Dict]:
+        subject_slug: str,
+        resume_journal: Optional[Path] = None
+    ) -> List[Turn]:
         """전체 토론 진행 (N명 참여)
 
         Args:
             debate_setup: 토론 설정 정보
             subject_slug: 파일명에 사용할 주제 키워드
+            resume_journal: 이어서 진행할 중단된 토론의 저널 경로 (None이면 새 토론)
 
         Returns:
             대화 히스토리
         """
-        # 토론 파일 초기화
-        self.file_manager.initialize_debate_file(debate_setup, subject_slug)
+        # 토론 파일 초기화 (이어하기면 저널에서 완료된 라운드까지 복구)
+        if resume_journal is None:
+            self.file_manager.initialize_debate_file(debate_setup, subject_slug)
+            conversation_history = []
+            resumed_rounds, finished = 0, False
+        else:
+            conversation_history, finished = self.file_manager.resume_debate_file(
+                debate_setup,
+                resume_journal
+            )
+            resumed_rounds = conversation_history[-1].round if conversation_history else 0
+            print(f"♻️  {resumed_rounds}라운드까지 진행된 토론을 이어갑니다.\n")
 
         num_participants = len(debate_setup.stances)
         num_rounds = debate_setup.num_rounds
-
-        # 라운드 생성
-        rounds = self._create_rounds(debate_setup.num_rounds, debate_setup.char_limit)
-
-        conversation_history = []
-        actual_round_num = 0
+        char_limit = debate_setup.char_limit
+        # 발언자 표시 문자열은 토론 내내 같으므로 한 번만 생성
+        speaker_labels = [
+            f"{stance.emoji} {stance.title} ({stance.ai_model.name})"
+            for stance in debate_setup.stances
+        ]
+
+        final_round_start = 0  # 최종 합의안 발언이 시작되는 히스토리 위치
+        actual_round_num = resumed_rounds
         min_rounds = 2  # 최소 진행 라운드
         last_ready_status = None
-
-        for i, round_info in enumerate(rounds):
-            actual_round_num = i + 1
-
-            print(f"\n{'='*60}")
-            print(f"📍 라운드 {actual_round_num}: {round_info['name']}")
-            print(f"{'='*60}\n")
-
-            # 발언 순서 결정
-            speaker_order = self._determine_speaker_order(
-                num_participants,
-                last_ready_status
-            )
-
-            # 모든 참여자 발언
-            for speaker_idx in speaker_order:
-                stance = debate_setup.stances[speaker_idx]
-                ai_model = stance.ai_model
-                emoji = stance.emoji
-
-                print(f"{emoji} {stance.title} ({ai_model.name}) 발언 중...")
-                response = self.get_ai_response(
-                    debate_setup,
-                    speaker_idx,
-                    conversation_history,
-                    round_info['instruction']
-                )
-
-                print(f"\n{emoji} {stance.title} ({ai_model.name}):")
-                print(f"{'-'*60}")
-                print(response)
-                print(f"{'-'*60}\n")
-
-                conversation_history.append({
-                    'speaker_idx': speaker_idx,
-                    'content': response,
-                    'round': actual_round_num
-                })
-
-                # 실시간으로 파일에 저장
-                self.file_manager.append_to_debate_file(
-                    debate_setup,
-                    speaker_idx,
-                    response,
-                    actual_round_num,
-                    round_info['name']
+        self._history_summary = ""
+        self._summary_cutoff = 0
+        self._latest_turns = {}
+        self._latest_turns_end = 0
+        self._prepare_preambles(debate_setup)
+
+        # 토론이 끝나거나 예외가 발생하면 기록 파일 핸들 정리
+        with self.file_manager:
+            # 라운드 일정은 필요할 때마다 생성 (조기 종료 시 나머지는 만들지 않음)
+            round_plan = self._round_plan(num_rounds, char_limit)
+            if finished:
+                # 최종 합의안까지 기록되어 있으면 결론 종합만 다시 수행
+                round_plan = iter(())
+                final_round_start = next(
+                    idx for idx, msg in enumerate(conversation_history)
+                    if msg.round == resumed_rounds
                 )
-
-                time.sleep(1)  # API 호출 간격
-
-            # 최종 합의안 라운드면 종료
-            if round_info['name'] == '최종 합의안':
-                break
-
-            # 합의 준비 확인
-            if actual_round_num >= min_rounds and i < len(rounds) - 1:
-                all_ready, ready_status = self._check_all_consensus_ready(
-                    debate_setup,
-                    conversation_history
+            # 이어하기면 이미 끝난 라운드는 건너뜀
+            round_plan = islice(round_plan, resumed_rounds, None)
+            for i, (round_name, instruction, is_final) in enumerate(round_plan, resumed_rounds):
+                actual_round_num = i + 1
+                round_start = len(conversation_history)
+
+                print("\n" + _BANNER)
+                print(f"📍 라운드 {actual_round_num}: {round_name}")
+                print(_BANNER + "\n")
+
+                # 발언 순서 결정
+                speaker_order = self._determine_speaker_order(
+                    num_participants,
+                    last_ready_status
                 )
 
-                if all_ready:
-                    # 최종 합의안 라운드로 이동
-                    print("🎉 모든 참여자가 합의 준비를 완료했습니다!")
-                    print("📝 최종 합의안 도출을 시작합니다.\n")
-
-                    final_round_info = {
-                        'name': '최종 합의안',
-                        'instruction': f'최종 합의안을 간결하고 구체적으로 제안해주세요. ({debate_setup.char_limit}자 이내)',
-                    }
-
-                    # 최종 합의안 라운드 진행
-                    for speaker_idx in range(num_participants):
-                        stance = debate_setup.stances[speaker_idx]
-                        emoji = stance.emoji
-                        ai_model = stance.ai_model
-
-                        print(f"{emoji} {stance.title} ({ai_model.name}) 최종 합의안 작성 중...")
-                        final_response = self.get_ai_response(
+                # 초기 주장과 최종 합의안은 같은 라운드의 다른 발언을 기다리지 않고
+                # 같은 히스토리를 기준으로 한꺼번에 병렬 호출
+                prefetched = None
+                if i == 0 or is_final:
+                    prefetched = self._collect_parallel_responses(
+                        debate_setup,
+                        speaker_order,
+                        speaker_labels,
+                        conversation_history,
+                        instruction
+                    )
+
+                # 모든 참여자 발언
+                for order_pos, speaker_idx in enumerate(speaker_order):
+                    speaker_label = speaker_labels[speaker_idx]
+
+                    if prefetched is not None:
+                        response = prefetched[order_pos]
+                        self._print_turn(speaker_label, response)
+                    else:
+                        print(f"{speaker_label} 발언 중...")
+                        response = self._speak(
                             debate_setup,
                             speaker_idx,
                             conversation_history,
-                            final_round_info['instruction']
+                            instruction,
+                            speaker_label
                         )
 
-                        print(f"\n{emoji} {stance.title} ({ai_model.name}):")
-                        print(f"{'-'*60}")
-                        print(final_response)
-                        print(f"{'-'*60}\n")
-
-                        conversation_history.append({
-                            'speaker_idx': speaker_idx,
-                            'content': final_response,
-                            'round': actual_round_num + 1
-                        })
+                    conversation_history.append(
+                        Turn(speaker_idx, response, actual_round_num)
+                    )
+
+                    # 실시간으로 파일에 저장
+                    self.file_manager.append_to_debate_file(
+                        debate_setup,
+                        speaker_idx,
+                        response,
+                        actual_round_num,
+                        round_name
+                    )
+
+                # 라운드가 끝나면 기록을 디스크에 반영
+                self.file_manager.flush_debate_file()
+
+                # 최종 합의안 라운드면 종료
+                if is_final:
+                    final_round_start = round_start
+                    break
 
-                        self.file_manager.append_to_debate_file(
+                # 직전 라운드만 원문으로 남기고 그 이전은 요약
+                if actual_round_num >= 2:
+                    self._update_history_summary(
+                        debate_setup,
+                        conversation_history,
+                        round_start
+                    )
+
+                # 합의 준비 확인
+                if actual_round_num >= min_rounds and i < num_rounds - 1:
+                    all_ready, ready_status = self._check_all_consensus_ready(
+                        debate_setup,
+                        conversation_history
+                    )
+
+                    if all_ready:
+                        # 최종 합의안 라운드로 이동
+                        print("🎉 모든 참여자가 합의 준비를 완료했습니다!")
+                        print("📝 최종 합의안 도출을 시작합니다.\n")
+
+                        final_instruction = self._final_round_instruction(char_limit)
+                        final_round_start = len(conversation_history)
+
+                        # 최종 합의안 라운드 진행 (모든 참여자 병렬 작성)
+                        final_order = list(range(num_participants))
+                        final_responses = self._collect_parallel_responses(
                             debate_setup,
-                            speaker_idx,
-                            final_response,
-                            actual_round_num + 1,
-                            final_round_info['name']
+                            final_order,
+                            speaker_labels,
+                            conversation_history,
+                            final_instruction,
+                            "최종 합의안 작성 중..."
                         )
-                        time.sleep(1)
 
-                    actual_round_num += 1
-                    break
-                else:
-                    last_ready_status = ready_status
-                    not_ready_count = sum(1 for r in ready_status if not r)
-                    print("➡️  토론을 계속 진행합니다.\n")
-                    print(f"ℹ️  다음 라운드에서는 반론 제기자({not_ready_count}명)가 먼저 발언합니다.\n")
-                    time.sleep(1)
-
-        # 최종 합의안 통합
-        final_round = [msg for msg in conversation_history if msg['round'] == actual_round_num]
+                        for speaker_idx, final_response in zip(final_order, final_responses):
+                            self._print_turn(speaker_labels[speaker_idx], final_response)
+
+                            conversation_history.append(
+                                Turn(speaker_idx, final_response, actual_round_num + 1)
+                            )
+
+                            self.file_manager.append_to_debate_file(
+                                debate_setup,
+                                speaker_idx,
+                                final_response,
+                                actual_round_num + 1,
+                                FINAL_ROUND_NAME
+                            )
+
+                        actual_round_num += 1
+                        break
+                    else:
+                        last_ready_status = ready_status
+                        not_ready_count = sum(1 for r in ready_status if not r)
+                        print("➡️  토론을 계속 진행합니다.\n")
+                        print(f"ℹ️  다음 라운드에서는 반론 제기자({not_ready_count}명)가 먼저 발언합니다.\n")
+
+        # 최종 합의안 통합 (최종 라운드 시작 위치부터 잘라 사용)
+        final_round = conversation_history[final_round_start:]
         unified_conclusion = self.synthesize_conclusion(debate_setup, final_round)
 
-        # 결론 파일 저장
-        self.file_manager.save_conclusion_file(
+        # 결론 파일 저장 (저장되면 이어하기용 저널은 더 이상 필요 없음)
+        conclusion_file = self.file_manager.save_conclusion_file(
             debate_setup,
             conversation_history,
             subject_slug,
             actual_round_num,
-            unified_conclusion
+            unified_conclusion,
+            final_round
         )
+        if conclusion_file is not None:
+            self.file_manager.discard_journal()
 
-        print(f"\n{'='*60}")
+        print("\n" + _BANNER)
         print(f"✅ 토론이 완료되었습니다! (총 {actual_round_num}라운드 진행)")
         print(f"📄 토론 전체 기록: {self.file_manager.current_debate_file.name}")
-        print(f"{'='*60}\n")
+        print(_BANNER + "\n")
 
         return conversation_history
 
@@ -200,8 +301,9 @@ class DebateEngine:
         self,
         debate_setup: DebateSetup,
         speaker_idx: int,
-        history: List[Dict],
-        instruction: str
+        history: List[Turn],
+        instruction: str,
+        stream: bool = False
     ) -> str:
         """특정 참여자의 AI 응답 생성 (글자 수 검증 포함)
 
@@ -210,60 +312,260 @@ class DebateEngine:
             speaker_idx: 발언자 인덱스
             history: 대화 히스토리
             instruction: 현재 라운드 지시사항
+            stream: True면 응답을 생성되는 대로 터미널에 출력
 
         Returns:
             AI 응답 텍스트
         """
-        stance = debate_setup.stances[speaker_idx]
-        ai_model = stance.ai_model
+        ai_model = debate_setup.stances[speaker_idx].ai_model
+        prompt = self._build_debate_prompt(debate_setup, speaker_idx, history, instruction)
+
+        try:
+            response = self.ai_client.call_ai_with_retry(prompt, ai_model, stream=stream)
+        except Exception as e:
+            print(f"❌ AI 응답 생성 중 오류: {e}")
+            if stream:
+                print(_FALLBACK_RESPONSE)
+            return _FALLBACK_RESPONSE
+
+        # 너무 짧은 경우 1회만 확장 재요청 (실패하면 원래 응답 사용)
+        # 짧은 답변은 이미 스트리밍으로 출력되었으므로 확장 답변은 스트리밍하지 않고
+        # 기록되는 답변임을 알 수 있게 구분해서 출력
+        expand_prompt = self._expand_prompt(debate_setup, response)
+        if expand_prompt is not None:
+            try:
+                response = self.ai_client.call_ai_with_retry(expand_prompt, ai_model)
+                print(f"✅ 확장 완료: {len(response)}자")
+                if stream:
+                    print(f"\n📝 확장된 답변 (이 답변이 기록됩니다):\n{response}")
+            except Exception as e:
+                print(f"⚠️  답변 확장 실패, 원래 답변 사용: {e}")
+
+        return response
+
+    def _build_debate_prompt(
+        self,
+        debate_setup: DebateSetup,
+        speaker_idx: int,
+        history: List[Turn],
+        instruction: str
+    ) -> str:
+        """발언 프롬프트 생성 (요약과 고정 머리말 재사용)
+
+        Args:
+            debate_setup: 토론 설정
+            speaker_idx: 발언자 인덱스
+            history: 대화 히스토리
+            instruction: 현재 라운드 지시사항
 
-        # 프롬프트 생성
-        prompt = self.prompt_generator.generate_debate_prompt(
+        Returns:
+            프롬프트 텍스트
+        """
+        return self.prompt_generator.generate_debate_prompt(
             debate_setup,
             speaker_idx,
             history,
-            instruction
+            instruction,
+            self._history_summary,
+            self._summary_cutoff,
+            self._debate_preambles[speaker_idx]
+            if self._preamble_setup is debate_setup else None
         )
 
-        try:
-            response = self.ai_client.call_ai(prompt, ai_model)
+    @staticmethod
+    def _expand_prompt(debate_setup: DebateSetup, response: str) -> Optional[bytes]:
+        """답변이 너무 짧으면 확장 요청 프롬프트 생성
+
+        최소 길이에 거의 도달한 답변(EXPAND_SKIP_RATIO 이상)은 그대로 사용합니다.
 
-            # 글자 수 검증
-            char_count = len(response)
-            min_limit = int(debate_setup.char_limit * MIN_CHAR_RATIO)
+        Args:
+            debate_setup: 토론 설정
+            response: 원본 답변
 
-            # 너무 짧은 경우 (1회만 재요청)
-            if char_count < min_limit:
-                print(f"⚠️  답변이 {char_count}자로 너무 짧습니다. 더 상세한 답변을 요청합니다... (최소 권장: {min_limit}자)")
+        Returns:
+            UTF-8로 인코딩된 확장 요청 프롬프트 또는 None (확장 불필요)
+        """
+        char_count = len(response)
+        char_limit = debate_setup.char_limit
+        min_limit = int(char_limit * MIN_CHAR_RATIO)
+        if char_count >= min_limit * EXPAND_SKIP_RATIO:
+            return None
+
+        print(f"⚠️  답변이 {char_count}자로 너무 짧습니다. 더 상세한 답변을 요청합니다... (최소 권장: {min_limit}자)")
+
+        # 원본 답변만 새로 인코딩하고 나머지는 미리 인코딩한 조각 재사용
+        return b"".join([
+            _EXPAND_PREFIX,
+            str(char_count).encode('ascii'),
+            _EXPAND_MID,
+            response.encode('utf-8'),
+            _EXPAND_SUFFIX % (min_limit, char_limit, char_limit)
+        ])
+
+    def _speak(
+        self,
+        debate_setup: DebateSetup,
+        speaker_idx: int,
+        history: List[Turn],
+        instruction: str,
+        speaker_label: str
+    ) -> str:
+        """순차 발언 하나를 생성하고 터미널에 출력
 
-                expand_prompt = f"""다음 답변이 {char_count}자로 너무 짧습니다.
+        스트리밍이 켜져 있으면 머리글을 먼저 출력하고 응답을 받는 대로 보여주며,
+        꺼져 있으면 응답이 완성된 뒤 한 번에 출력합니다.
 
-원본 답변:
-{response}
+        Args:
+            debate_setup: 토론 설정
+            speaker_idx: 발언자 인덱스
+            history: 대화 히스토리
+            instruction: 현재 라운드 지시사항
+            speaker_label: 출력용 발언자 라벨
 
-**더 상세하게 작성해주세요:**
-- 구체적인 근거와 예시를 추가하세요
-- 논점을 더 명확하게 설명하세요
-- 목표: {min_limit}-{debate_setup.char_limit}자 정도
-- 하지만 {debate_setup.char_limit}자는 넘지 마세요
+        Returns:
+            AI 응답 텍스트
+        """
+        if not self.stream_output:
+            response = self.get_ai_response(debate_setup, speaker_idx, history, instruction)
+            self._print_turn(speaker_label, response)
+            return response
 
-상세한 답변만 출력하세요 (다른 설명 없이)."""
+        print(f"\n{speaker_label}:")
+        print(_RULE)
+        response = self.get_ai_response(
+            debate_setup, speaker_idx, history, instruction, stream=True
+        )
+        print(_RULE + "\n")
+        return response
 
-                response = self.ai_client.call_ai(expand_prompt, ai_model)
-                char_count = len(response)
-                print(f"✅ 확장 완료: {char_count}자")
+    @staticmethod
+    def _print_turn(speaker_label: str, response: str) -> None:
+        """완성된 발언을 구분선과 함께 출력
 
-            return response
+        Args:
+            speaker_label: 출력용 발언자 라벨
+            response: 발언 내용
+        """
+        print(f"\n{speaker_label}:")
+        print(_RULE)
+        print(response)
+        print(_RULE + "\n")
+
+    def _collect_parallel_responses(
+        self,
+        debate_setup: DebateSetup,
+        speaker_order: List[int],
+        speaker_labels: List[str],
+        history: List[Turn],
+        instruction: str,
+        status: str = "발언 중..."
+    ) -> List[str]:
+        """같은 히스토리를 기준으로 여러 참여자의 응답을 병렬로 생성
+
+        Args:
+            debate_setup: 토론 설정
+            speaker_order: 발언 순서
+            speaker_labels: 참여자별 표시 문자열
+            history: 대화 히스토리 (호출 동안 변경하지 않음)
+            instruction: 현재 라운드 지시사항
+            status: 호출 전에 참여자별로 출력할 진행 상태 문구
+
+        Returns:
+            speaker_order 순서의 응답 리스트
+        """
+        for speaker_idx in speaker_order:
+            print(f"{speaker_labels[speaker_idx]} {status}")
+
+        models = [debate_setup.stances[idx].ai_model for idx in speaker_order]
+        requests = [
+            (self._build_debate_prompt(debate_setup, idx, history, instruction), model)
+            for idx, model in zip(speaker_order, models)
+        ]
+        responses = self.ai_client.call_many(requests, return_exceptions=True)
+
+        # 너무 짧은 답변의 확장 요청도 한꺼번에 병렬로
+        expand_requests = {}
+        for pos, response in enumerate(responses):
+            if isinstance(response, Exception):
+                print(f"❌ AI 응답 생성 중 오류: {response}")
+                responses[pos] = _FALLBACK_RESPONSE
+                continue
+            expand_prompt = self._expand_prompt(debate_setup, response)
+            if expand_prompt is not None:
+                expand_requests[pos] = (expand_prompt, models[pos])
+
+        expanded = self.ai_client.call_many(
+            list(expand_requests.values()),
+            return_exceptions=True
+        )
+        for pos, response in zip(expand_requests, expanded):
+            if isinstance(response, Exception):
+                # 확장 전 응답도 유효하므로 그대로 사용
+                print(f"⚠️  답변 확장 실패, 원래 답변 사용: {response}")
+            else:
+                responses[pos] = response
+                print(f"✅ 확장 완료: {len(response)}자")
+
+        return responses
+
+    def _prepare_preambles(self, debate_setup: DebateSetup) -> None:
+        """참여자별 고정 머리말을 미리 생성
+
+        주제, 입장, 토론 규칙은 토론 내내 변하지 않으므로
+        매 발언마다 다시 만들지 않습니다.
+
+        Args:
+            debate_setup: 토론 설정
+        """
+        num_participants = len(debate_setup.stances)
+        self._debate_preambles = [
+            self.prompt_generator.generate_debate_preamble(debate_setup, idx)
+            for idx in range(num_participants)
+        ]
+        self._consensus_preambles = [
+            self.prompt_generator.generate_consensus_preamble(debate_setup, idx)
+            for idx in range(num_participants)
+        ]
+        self._preamble_setup = debate_setup
+
+    def _update_history_summary(
+        self,
+        debate_setup: DebateSetup,
+        history: List[Turn],
+        cutoff: int
+    ) -> None:
+        """history[:cutoff]까지를 요약하여 저장 (기존 요약에 새 메시지만 추가)
+
+        Args:
+            debate_setup: 토론 설정
+            history: 대화 히스토리
+            cutoff: 요약할 메시지 수 (이후 메시지는 원문 유지)
+        """
+        if cutoff <= self._summary_cutoff:
+            return
+
+        prompt = self.prompt_generator.generate_history_summary_prompt(
+            debate_setup,
+            self._history_summary,
+            history[self._summary_cutoff:cutoff]
+        )
 
+        try:
+            print("📚 이전 라운드 요약 중...")
+            summary = self.ai_client.call_ai(prompt, debate_setup.stances[0].ai_model)
         except Exception as e:
-            print(f"❌ AI 응답 생성 중 오류: {e}")
-            return "응답 생성 중 오류가 발생했습니다."
+            # 요약 실패 시 기존 상태 유지 (원문 히스토리로 계속 진행)
+            print(f"⚠️  이전 라운드 요약 실패: {e}")
+            return
+
+        self._history_summary = summary
+        self._summary_cutoff = cutoff
 
     def check_consensus_ready(
         self,
         debate_setup: DebateSetup,
         speaker_idx: int,
-        history: List[Dict]
+        history: List[Turn]
     ) -> bool:
         """특정 참여자의 합의 준비 여부 확인
 
@@ -276,24 +578,182 @@ class DebateEngine:
             준비 완료 여부 (True/False)
         """
         stance = debate_setup.stances[speaker_idx]
+
+        # 직전 발언에 합의 표현이 뚜렷하면 AI 호출 없이 준비 완료로 판단
+        last_content = self._latest_turns_for(history).get(speaker_idx, "")
+        if self._signals_consensus(last_content):
+            return True
+
         prompt = self.prompt_generator.generate_consensus_check_prompt(
             debate_setup,
             speaker_idx,
-            history
+            history,
+            self._consensus_preambles[speaker_idx]
+            if self._preamble_setup is debate_setup else None
         )
 
         try:
-            response = self.ai_client.call_ai(prompt, stance.ai_model)
-            response_upper = response.strip().upper()
-            return "YES" in response_upper or "준비" in response
+            response = self.ai_client.call_ai_with_retry(prompt, stance.ai_model)
+            return self._is_ready_answer(response)
         except Exception as e:
             print(f"⚠️  {stance.title} 합의 확인 실패: {e}")
             return False
 
+    def check_consensus_ready_batch(
+        self,
+        debate_setup: DebateSetup,
+        history: List[Turn]
+    ) -> List[bool]:
+        """전체 참여자의 합의 준비 여부를 AI 모델별 한 번의 호출로 확인
+
+        같은 AI 모델을 쓰는 참여자들은 그 모델에 한 번에 묻고,
+        서로 다른 모델에 대한 호출은 병렬로 진행합니다.
+        직전 발언에 합의 표현이 뚜렷한 참여자는 AI에 묻지 않고 준비 완료로 봅니다.
+
+        Args:
+            debate_setup: 토론 설정
+            history: 대화 히스토리
+
+        Returns:
+            참여자 순서의 준비 여부 리스트
+        """
+        num_participants = len(debate_setup.stances)
+
+        latest_turns = self._latest_turns_for(history)
+        ready_status = [
+            self._signals_consensus(latest_turns.get(idx, ""))
+            for idx in range(num_participants)
+        ]
+
+        # 아직 판단이 필요한 참여자를 AI 모델별로 묶음
+        groups: Dict[AIModel, List[int]] = {}
+        for idx, stance in enumerate(debate_setup.stances):
+            if not ready_status[idx]:
+                groups.setdefault(stance.ai_model, []).append(idx)
+
+        if not groups:
+            return ready_status
+
+        with ThreadPoolExecutor(max_workers=len(groups)) as executor:
+            results = list(executor.map(
+                lambda item: self._check_consensus_group(debate_setup, history, *item),
+                groups.items()
+            ))
+
+        for indices, answers in zip(groups.values(), results):
+            for idx, is_ready in zip(indices, answers):
+                ready_status[idx] = is_ready
+
+        return ready_status
+
+    def _check_consensus_group(
+        self,
+        debate_setup: DebateSetup,
+        history: List[Turn],
+        ai_model: AIModel,
+        indices: List[int]
+    ) -> List[bool]:
+        """같은 AI 모델을 쓰는 참여자들의 합의 준비 여부를 한 번에 확인
+
+        응답을 해석할 수 없으면 해당 참여자들만 개별로 다시 확인합니다.
+
+        Args:
+            debate_setup: 토론 설정
+            history: 대화 히스토리
+            ai_model: 질의할 AI 모델
+            indices: 판단할 참여자 인덱스
+
+        Returns:
+            indices 순서의 준비 여부 리스트
+        """
+        prompt = self.prompt_generator.generate_batch_consensus_prompt(
+            debate_setup,
+            history,
+            indices
+        )
+
+        answers = None
+        try:
+            response = self.ai_client.call_ai_with_retry(prompt, ai_model)
+            # 응답에서 JSON 배열 부분만 추출
+            answers = json.loads(response[response.index('['):response.rindex(']') + 1])
+        except ValueError:
+            pass
+        except Exception as e:
+            print(f"⚠️  {ai_model.name} 일괄 합의 확인 실패: {e}")
+
+        if isinstance(answers, list) and len(answers) == len(indices):
+            return [self._is_ready_answer(str(answer)) for answer in answers]
+
+        print(f"⚠️  {ai_model.name} 일괄 합의 확인 응답을 해석할 수 없어 참여자별로 확인합니다.")
+        # 참여자별 확인은 서로 독립적이므로 병렬로 호출 (결과는 indices 순서 유지)
+        with ThreadPoolExecutor(max_workers=len(indices)) as executor:
+            return list(executor.map(
+                lambda idx: self.check_consensus_ready(debate_setup, idx, history),
+                indices
+            ))
+
+    def _latest_turns_for(self, history: List[Turn]) -> Dict[int, str]:
+        """참여자별 마지막 발언 반환 (지난 호출 이후 추가된 발언만 반영, 내부 메서드)
+
+        Args:
+            history: 대화 히스토리
+
+        Returns:
+            {참여자 인덱스: 마지막 발언 내용}
+        """
+        if self._latest_turns_end > len(history):
+            # 히스토리가 줄었으면 (새 토론 등) 처음부터 다시 계산
+            self._latest_turns = {}
+            self._latest_turns_end = 0
+
+        if self._latest_turns_end < len(history):
+            for msg in islice(history, self._latest_turns_end, None):
+                self._latest_turns[msg.speaker_idx] = msg.content
+            self._latest_turns_end = len(history)
+
+        return self._latest_turns
+
+    @staticmethod
+    def _is_ready_answer(response: str) -> bool:
+        """합의 준비 확인 응답이 준비 완료를 뜻하는지 판단
+
+        Args:
+            response: AI 응답 (YES 또는 NO 단답을 기대)
+
+        Returns:
+            맨 앞 단어가 YES이거나, YES/NO 없이 부정 없는 준비 완료 표현이면 True
+        """
+        response = response.strip()
+        token = _READY_TOKEN_RE.match(response)
+        if token:
+            return token.group(1).upper() == "YES"
+
+        head = response[:_READY_ANSWER_SCAN]
+        return (
+            _READY_KO_RE.search(head) is not None
+            and _NOT_READY_RE.search(head) is None
+        )
+
+    @staticmethod
+    def _signals_consensus(content: str) -> bool:
+        """발언 내용만으로 합의 준비가 명확한지 판단
+
+        Args:
+            content: 발언 내용
+
+        Returns:
+            반대·부정 표현이 전혀 없고 합의 표현이 충분하면 True
+        """
+        if any(marker in content for marker in _DISAGREE_MARKERS):
+            return False
+        agree = sum(content.count(marker) for marker in _CONSENSUS_MARKERS)
+        return agree >= _MIN_CONSENSUS_MARKERS
+
     def synthesize_conclusion(
         self,
         debate_setup: DebateSetup,
-        final_proposals: List[Dict]
+        final_proposals: List[Turn]
     ) -> str:
         """모든 참여자의 최종 합의안을 종합하여 통합된 결론 생성
 
@@ -313,45 +773,68 @@ class DebateEngine:
             # 첫 번째 사용 가능한 모델로 통합 결론 생성
             first_model = debate_setup.stances[0].ai_model
             print("🤖 최종 합의안 종합 중...")
-            unified_conclusion = self.ai_client.call_ai(prompt, first_model)
+            unified_conclusion = self.ai_client.call_ai_with_retry(prompt, first_model)
             print("✅ 통합 결론 생성 완료\n")
             return unified_conclusion
         except Exception as e:
             print(f"⚠️  통합 결론 생성 실패: {e}")
             return "통합 결론 생성 중 오류가 발생했습니다."
 
-    def _create_rounds(self, num_rounds: int, char_limit: int) -> List[Dict]:
-        """라운드 정보 생성
+    def _round_plan(
+        self,
+        num_rounds: int,
+        char_limit: int
+    ) -> Iterator[Tuple[str, str, bool]]:
+        """라운드 일정 생성
 
         Args:
             num_rounds: 총 라운드 수
             char_limit: 글자 수 제한
 
-        Returns:
-            라운드 정보 리스트
+        Yields:
+            (라운드 이름, 지시사항, 최종 합의안 라운드 여부)
         """
-        rounds = []
+        # 중간 라운드 지시사항은 라운드마다 같으므로 한 번만 생성
+        length_hint = self._length_hint(char_limit)
+        debate_instruction = f'다른 참여자의 주장에 대해 반박하거나 질문하고, 타당한 지적은 인정하며, 합의점을 찾아가세요. ({length_hint})'
+
         for i in range(num_rounds):
             if i == 0 and num_rounds >= 2:
                 # 첫 번째 라운드: 초기 주장
-                round_info = {
-                    'name': '초기 주장',
-                    'instruction': f'핵심 주장을 간결하게 제시해주세요. ({char_limit}자 이내)',
-                }
+                yield '초기 주장', f'핵심 주장을 간결하게 제시해주세요. ({length_hint})', False
             elif i == num_rounds - 1:
                 # 마지막 라운드: 최종 합의안
-                round_info = {
-                    'name': '최종 합의안',
-                    'instruction': f'최종 합의안을 간결하고 구체적으로 제안해주세요. ({char_limit}자 이내)',
-                }
+                yield FINAL_ROUND_NAME, self._final_round_instruction(char_limit), True
             else:
                 # 중간 라운드: 토론
-                round_info = {
-                    'name': f'토론 {i}',
-                    'instruction': f'다른 참여자의 주장에 대해 반박하거나 질문하고, 타당한 지적은 인정하며, 합의점을 찾아가세요. ({char_limit}자 이내)',
-                }
-            rounds.append(round_info)
-        return rounds
+                yield f'토론 {i}', debate_instruction, False
+
+    @classmethod
+    def _final_round_instruction(cls, char_limit: int) -> str:
+        """최종 합의안 라운드 지시사항
+
+        Args:
+            char_limit: 글자 수 제한
+
+        Returns:
+            지시사항 텍스트
+        """
+        return f'최종 합의안을 간결하고 구체적으로 제안해주세요. ({cls._length_hint(char_limit)})'
+
+    @staticmethod
+    def _length_hint(char_limit: int) -> str:
+        """지시사항에 붙일 답변 길이 안내
+
+        최소 길이를 처음부터 알려 주어 짧은 답변으로 인한 확장 재요청을 줄입니다.
+
+        Args:
+            char_limit: 글자 수 제한
+
+        Returns:
+            길이 안내 텍스트 (예: "최소 75자 이상, 300자 이내")
+        """
+        min_limit = int(char_limit * MIN_CHAR_RATIO)
+        return f'최소 {min_limit}자 이상, {char_limit}자 이내'
 
     def _determine_speaker_order(
         self,
@@ -368,9 +851,10 @@ class DebateEngine:
             발언 순서 (인덱스 리스트)
         """
         if last_ready_status is not None:
-            # 준비 안 된 참여자(반론 제기자) 먼저, 준비된 참여자 나중에
-            not_ready_indices = [idx for idx, ready in enumerate(last_ready_status) if not ready]
-            ready_indices = [idx for idx, ready in enumerate(last_ready_status) if ready]
+            # 준비 안 된 참여자(반론 제기자) 먼저, 준비된 참여자 나중에 (한 번만 순회)
+            not_ready_indices, ready_indices = [], []
+            for idx, ready in enumerate(last_ready_status):
+                (ready_indices if ready else not_ready_indices).append(idx)
             speaker_order = not_ready_indices + ready_indices
 
             if not_ready_indices:
@@ -384,7 +868,7 @@ class DebateEngine:
     def _check_all_consensus_ready(
         self,
         debate_setup: DebateSetup,
-        history: List[Dict]
+        history: List[Turn]
     ) -> Tuple[bool, List[bool]]:
         """모든 참여자의 합의 준비 상태 확인
 
@@ -399,15 +883,13 @@ class DebateEngine:
         print("🤝 모든 참여자의 합의 준비 상태를 확인합니다...")
         print(f"{'~'*60}\n")
 
-        ready_status = []
-
-        for i, stance in enumerate(debate_setup.stances):
-            is_ready = self.check_consensus_ready(debate_setup, i, history)
-            ready_status.append(is_ready)
+        # AI 모델별로 한 번씩만 호출하여 확인
+        ready_status = self.check_consensus_ready_batch(debate_setup, history)
 
-            emoji = stance.emoji
+        # 결과는 참여자 순서대로 출력
+        for stance, is_ready in zip(debate_setup.stances, ready_status):
             status_icon = "✅ 준비 완료" if is_ready else "⏳ 토론 계속"
-            print(f"{emoji} {stance.title}: {status_icon}")
+            print(f"{stance.emoji} {stance.title}: {status_icon}")
 
         print()
 
@@ -1,14 +1,105 @@
 """AI 모델 관리 서비스"""
 
+import shutil
 import subprocess
-from typing import Dict, Tuple
+import threading
+from functools import lru_cache
+from typing import Dict, List
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from ai_debate.models.ai_model import AIModel
 from ai_debate.io.cache_manager import CacheManager
-from ai_debate.config.constants import ALL_AI_MODELS, MODEL_CHECK_TIMEOUT
+from ai_debate.config.constants import (
+    ALL_AI_MODELS,
+    MODEL_CHECK_TIMEOUT,
+    WARMUP_PROMPT,
+    WARMUP_TIMEOUT,
+)
 from ai_debate.exceptions import NoAvailableModelsError
 
 
+@lru_cache(maxsize=16)
+def _probe_model(model: AIModel) -> bool:
+    """AI 모델 CLI를 실제로 호출하여 사용 가능 여부 확인
+
+    같은 프로세스에서는 모델별로 한 번만 프로세스를 띄웁니다
+    (AIModel은 불변 객체라 그대로 캐시 키로 사용).
+
+    Args:
+        model: AI 모델 정보
+
+    Returns:
+        사용 가능하면 True, 아니면 False
+    """
+    # 1단계: CLI 설치 확인 (빠른 체크)
+    test_cmd = model.test_command or model.command[:1] + ("--version",)
+
+    # 실행 파일이 PATH에 없으면 프로세스를 띄우지 않고 바로 False
+    if shutil.which(test_cmd[0]) is None:
+        return False
+
+    try:
+        # 종료 코드만 확인하므로 출력은 버림 (파이프 생성/디코딩 생략)
+        result = subprocess.run(
+            test_cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=MODEL_CHECK_TIMEOUT * 2
+        )
+        # CLI가 없거나 심각한 오류면 즉시 False
+        if result.returncode not in [0, 1]:
+            return False
+    except FileNotFoundError:
+        return False
+    except subprocess.TimeoutExpired:
+        # 타임아웃은 실행은 되지만 응답이 느린 경우
+        pass
+    except Exception:
+        return False
+
+    # 2단계: 실제 API 호출 테스트 (간단한 호출로 크레딧/인증 확인)
+    try:
+        test_prompt = "ok"
+        result = subprocess.run(
+            (*model.command, test_prompt),
+            capture_output=True,
+            text=True,
+            timeout=10.0,  # AI API 호출은 충분한 시간 필요 (10초)
+            encoding='utf-8'
+        )
+
+        # stdout과 stderr 모두에서 명확한 에러만 확인
+        output = (result.stdout + result.stderr).lower()
+
+        # 크레딧/인증 관련 명확한 에러 키워드
+        critical_errors = [
+            "doesn't have any credits",
+            'purchase credits',
+            'no credits',
+            'credit balance',
+            'billing',
+            'payment required'
+        ]
+
+        # 명확한 크레딧/결제 에러가 있으면 사용 불가
+        if any(error in output for error in critical_errors):
+            return False
+
+        # returncode 0이면 성공
+        if result.returncode == 0:
+            return True
+
+        # 그 외의 경우는 CLI가 설치되어 있으므로 사용 가능으로 간주
+        # (API 키 설정 등은 사용자가 실제 사용 시 해결할 문제)
+        return True
+
+    except subprocess.TimeoutExpired:
+        # 타임아웃 = API가 느리지만 동작함 (사용 가능)
+        return True
+    except Exception:
+        # 기타 에러는 CLI가 설치되어 있으므로 사용 가능으로 간주
+        return True
+
+
 class ModelManager:
     """AI 모델 가용성 확인 및 관리
 
@@ -24,6 +115,8 @@ class ModelManager:
         """
         self.cache_manager = cache_manager
         self.available_models: Dict[str, AIModel] = {}
+        # 이번 실행에서 실제 CLI 호출로 확인했는지 (이미 예열된 상태)
+        self._probed: bool = False
 
     def check_model_availability(
         self,
@@ -32,6 +125,8 @@ class ModelManager:
     ) -> bool:
         """특정 AI 모델의 CLI가 사용 가능한지 확인
 
+        이번 실행에서 이미 확인한 모델이면 이전 결과를 그대로 반환합니다.
+
         Args:
             model_key: 모델 키 (예: "claude")
             model: AI 모델 정보
@@ -39,70 +134,7 @@ class ModelManager:
         Returns:
             사용 가능하면 True, 아니면 False
         """
-        # 1단계: CLI 설치 확인 (빠른 체크)
-        test_cmd = model.test_command or model.command[:1] + ["--version"]
-
-        try:
-            result = subprocess.run(
-                test_cmd,
-                capture_output=True,
-                text=True,
-                timeout=MODEL_CHECK_TIMEOUT * 2,
-                encoding='utf-8'
-            )
-            # CLI가 없거나 심각한 오류면 즉시 False
-            if result.returncode not in [0, 1]:
-                return False
-        except FileNotFoundError:
-            return False
-        except subprocess.TimeoutExpired:
-            # 타임아웃은 실행은 되지만 응답이 느린 경우
-            pass
-        except Exception:
-            return False
-
-        # 2단계: 실제 API 호출 테스트 (간단한 호출로 크레딧/인증 확인)
-        try:
-            test_prompt = "ok"
-            result = subprocess.run(
-                model.command + [test_prompt],
-                capture_output=True,
-                text=True,
-                timeout=10.0,  # AI API 호출은 충분한 시간 필요 (10초)
-                encoding='utf-8'
-            )
-
-            # stdout과 stderr 모두에서 명확한 에러만 확인
-            output = (result.stdout + result.stderr).lower()
-
-            # 크레딧/인증 관련 명확한 에러 키워드
-            critical_errors = [
-                "doesn't have any credits",
-                'purchase credits',
-                'no credits',
-                'credit balance',
-                'billing',
-                'payment required'
-            ]
-
-            # 명확한 크레딧/결제 에러가 있으면 사용 불가
-            if any(error in output for error in critical_errors):
-                return False
-
-            # returncode 0이면 성공
-            if result.returncode == 0:
-                return True
-
-            # 그 외의 경우는 CLI가 설치되어 있으므로 사용 가능으로 간주
-            # (API 키 설정 등은 사용자가 실제 사용 시 해결할 문제)
-            return True
-
-        except subprocess.TimeoutExpired:
-            # 타임아웃 = API가 느리지만 동작함 (사용 가능)
-            return True
-        except Exception:
-            # 기타 에러는 CLI가 설치되어 있으므로 사용 가능으로 간주
-            return True
+        return _probe_model(model)
 
     def initialize_models(self, force_refresh: bool = False) -> None:
         """사용 가능한 AI 모델 확인 및 초기화
@@ -114,8 +146,11 @@ class ModelManager:
             NoAvailableModelsError: 사용 가능한 모델이 없을 경우
         """
         # 캐시 확인 (force_refresh가 아닐 때만)
-        if not force_refresh:
-            cached_keys = self.cache_manager.load_cached_models()
+        if force_refresh:
+            # 이번 실행에서 이미 확인한 결과도 버리고 다시 호출
+            _probe_model.cache_clear()
+        else:
+            cached_keys, is_fresh = self.cache_manager.load_cached_models()
             if cached_keys:
                 print("✅ 캐시된 AI 모델 정보 사용")
                 self.available_models = {
@@ -126,6 +161,11 @@ class ModelManager:
                 if self.available_models:
                     model_names = ', '.join(m.display_name for m in self.available_models.values())
                     print(f"🤖 사용 가능한 AI 모델: {model_names}\n")
+                    self._probed = False
+                    if not is_fresh:
+                        # 오래된 캐시는 일단 사용하고 백그라운드에서 재확인 (시작 지연 없음)
+                        print("ℹ️  모델 캐시가 오래되어 백그라운드에서 다시 확인합니다.\n")
+                        self._start_revalidation()
                     return
                 else:
                     print("⚠️  캐시된 모델이 유효하지 않습니다. 재확인합니다...\n")
@@ -136,9 +176,36 @@ class ModelManager:
 
         # 초기화 (이전 데이터 제거)
         self.available_models.clear()
-        available_keys = []
+        available_keys = self._probe_models(verbose=True)
+        for key in available_keys:
+            self.available_models[key] = ALL_AI_MODELS[key]
+
+        print("-" * 60)
+
+        # 사용 가능한 모델이 없으면 에러
+        if not self.available_models:
+            error_msg = self._get_installation_guide()
+            raise NoAvailableModelsError(error_msg)
+
+        # 캐시 저장
+        self.cache_manager.save_cached_models(available_keys)
+        self._probed = True
+
+        print(f"\n✅ {len(self.available_models)}개의 AI 모델 사용 가능")
+        model_names = ', '.join(m.display_name for m in self.available_models.values())
+        print(f"🤖 사용 가능한 모델: {model_names}\n")
+
+    def _probe_models(self, verbose: bool) -> List[str]:
+        """모든 AI 모델의 가용성을 병렬로 확인
+
+        Args:
+            verbose: True면 모델별 결과를 완료되는 대로 출력
+
+        Returns:
+            사용 가능한 모델 키 리스트 (ALL_AI_MODELS 정의 순서)
+        """
+        available = set()
 
-        # 병렬로 모든 모델 확인
         with ThreadPoolExecutor(max_workers=len(ALL_AI_MODELS)) as executor:
             # 모든 모델 확인 작업 제출
             future_to_model = {
@@ -151,28 +218,76 @@ class ModelManager:
                 model_key, model = future_to_model[future]
                 try:
                     is_available = future.result()
-                    if is_available:
-                        self.available_models[model_key] = model
-                        available_keys.append(model_key)
-                        print(f"  ✅ {model.display_name} - 사용 가능")
-                    else:
-                        print(f"  ❌ {model.display_name} - 사용 불가")
                 except Exception as e:
-                    print(f"  ❌ {model.display_name} - 확인 실패: {e}")
+                    if verbose:
+                        print(f"  ❌ {model.display_name} - 확인 실패: {e}")
+                    continue
 
-        print("-" * 60)
+                if is_available:
+                    available.add(model_key)
+                if verbose:
+                    status = "사용 가능" if is_available else "사용 불가"
+                    icon = "✅" if is_available else "❌"
+                    print(f"  {icon} {model.display_name} - {status}")
 
-        # 사용 가능한 모델이 없으면 에러
-        if not self.available_models:
-            error_msg = self._get_installation_guide()
-            raise NoAvailableModelsError(error_msg)
+        # 결과 출력은 완료 순서대로 하되, 모델 목록은 확인 속도와 무관하게 항상 같은 순서로
+        return [key for key in ALL_AI_MODELS if key in available]
 
-        # 캐시 저장
-        self.cache_manager.save_cached_models(available_keys)
+    def _start_revalidation(self) -> None:
+        """오래된 모델 캐시를 백그라운드에서 재확인하여 갱신
 
-        print(f"\n✅ {len(self.available_models)}개의 AI 모델 사용 가능")
-        model_names = ', '.join(m.display_name for m in self.available_models.values())
-        print(f"🤖 사용 가능한 모델: {model_names}\n")
+        가용성 확인은 각 CLI를 실제로 호출하므로 예열도 겸합니다.
+        이번 실행의 모델 목록은 바꾸지 않고, 결과는 다음 실행부터 반영됩니다.
+        """
+        self._probed = True
+        threading.Thread(target=self._revalidate_cache, daemon=True).start()
+
+    def _revalidate_cache(self) -> None:
+        """모델 가용성을 다시 확인하여 캐시 저장 (백그라운드 스레드용)"""
+        try:
+            available_keys = self._probe_models(verbose=False)
+            # 하나도 확인되지 않으면 기존 캐시 유지
+            if available_keys:
+                self.cache_manager.save_cached_models(available_keys)
+        except Exception:
+            # 재확인 실패 시 기존 캐시를 계속 사용
+            pass
+
+    def warmup_models(self) -> None:
+        """사용 가능한 모든 AI CLI를 백그라운드에서 예열
+
+        사용자가 토론 설정을 입력하는 동안 짧은 프롬프트를 보내
+        CLI 실행 파일, 인증, 네트워크 연결을 미리 준비합니다.
+        이번 실행에서 이미 가용성 확인으로 CLI를 호출했다면 생략합니다.
+        """
+        if self._probed or not self.available_models:
+            return
+
+        for model in self.available_models.values():
+            threading.Thread(
+                target=self._warmup_model,
+                args=(model,),
+                daemon=True
+            ).start()
+
+    @staticmethod
+    def _warmup_model(model: AIModel) -> None:
+        """AI CLI에 예열용 프롬프트 전송 (결과는 사용하지 않음)
+
+        Args:
+            model: 예열할 AI 모델
+        """
+        try:
+            subprocess.run(
+                model.command,
+                input=WARMUP_PROMPT.encode('utf-8'),
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=WARMUP_TIMEOUT
+            )
+        except Exception:
+            # 예열 실패는 토론 진행에 영향 없음
+            pass
 
     def get_available_models(self) -> Dict[str, AIModel]:
         """사용 가능한 모델 반환
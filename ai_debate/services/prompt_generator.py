@@ -1,12 +1,18 @@
 """프롬프트 생성 서비스"""
 
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 from ai_debate.models.debate_setup import DebateSetup
+from ai_debate.models.turn import Turn
 
 
 class PromptGenerator:
     """토론 시스템에서 사용하는 모든 프롬프트 생성"""
 
+    def __init__(self):
+        # 발언자 -> (시작 위치, 끝 위치, 히스토리 텍스트, 메시지별 텍스트 시작 오프셋)
+        self._history_cache: Dict[int, Tuple[int, int, str, List[int]]] = {}
+        self._history_owner: Optional[List[Turn]] = None
+
     def generate_filename_keyword_prompt(self, topic: str) -> str:
         """파일명 키워드 생성 프롬프트
 
@@ -55,23 +61,22 @@ class PromptGenerator:
 
 다른 설명 없이 제목만 답변해주세요."""
 
-    def generate_debate_prompt(
+    def generate_debate_preamble(
         self,
         debate_setup: DebateSetup,
-        speaker_idx: int,
-        history: List[Dict],
-        instruction: str
+        speaker_idx: int
     ) -> str:
-        """토론 프롬프트 생성
+        """토론 프롬프트의 고정 머리말 생성
+
+        주제, 입장, 토론 규칙은 토론 내내 변하지 않으므로
+        참여자별로 한 번만 생성해 재사용할 수 있습니다.
 
         Args:
             debate_setup: 토론 설정
             speaker_idx: 발언자 인덱스
-            history: 대화 히스토리
-            instruction: 현재 라운드 지시사항
 
         Returns:
-            프롬프트 텍스트
+            머리말 텍스트
         """
         stance = debate_setup.stances[speaker_idx]
 
@@ -83,7 +88,7 @@ class PromptGenerator:
 
         other_stances_text = "\n".join(other_stances)
 
-        prompt = f"""당신은 "{stance.title}"입니다.
+        return f"""당신은 "{stance.title}"입니다.
 
 토론 주제: {debate_setup.topic}
 
@@ -102,28 +107,179 @@ class PromptGenerator:
 - 타당한 지적만 수용하고, 반박 가능한 부분은 절대 놓치지 마세요
 - 상대 주장의 약점을 찾아내고, 대안이나 반례를 제시하세요
 
-현재 지시사항: {instruction}
+"""
+
+    def generate_debate_prompt(
+        self,
+        debate_setup: DebateSetup,
+        speaker_idx: int,
+        history: List[Turn],
+        instruction: str,
+        history_summary: str = "",
+        summarized_count: int = 0,
+        preamble: Optional[str] = None
+    ) -> str:
+        """토론 프롬프트 생성
+
+        Args:
+            debate_setup: 토론 설정
+            speaker_idx: 발언자 인덱스
+            history: 대화 히스토리
+            instruction: 현재 라운드 지시사항
+            history_summary: 앞부분 히스토리의 요약 (없으면 빈 문자열)
+            summarized_count: 요약으로 대체된 앞부분 메시지 수
+            preamble: 미리 생성한 고정 머리말 (None이면 새로 생성)
+
+        Returns:
+            프롬프트 텍스트
+        """
+        if preamble is None:
+            preamble = self.generate_debate_preamble(debate_setup, speaker_idx)
+
+        parts = [preamble, f"""현재 지시사항: {instruction}
 
-한국어로 자연스럽게 답변해주세요."""
+한국어로 자연스럽게 답변해주세요."""]
 
-        # 대화 히스토리 추가
+        # 대화 히스토리 추가 (마지막에 한 번만 결합)
         if history:
-            prompt += "\n\n지금까지의 토론 내용:\n\n"
-            for msg in history:
-                if msg['speaker_idx'] == speaker_idx:
+            parts.append("\n\n지금까지의 토론 내용:\n\n")
+            if history_summary:
+                # 요약된 앞부분은 원문 대신 요약만 전달
+                parts.append(f"[이전 토론 요약]\n{history_summary}\n\n")
+            else:
+                summarized_count = 0
+            parts.append(self._format_history(
+                debate_setup, history, speaker_idx, summarized_count
+            ))
+
+        return "".join(parts)
+
+    def _format_history(
+        self,
+        debate_setup: DebateSetup,
+        history: List[Turn],
+        speaker_idx: int,
+        start: int = 0
+    ) -> str:
+        """발언자 시점의 히스토리 텍스트 생성 (증분 캐시)
+
+        히스토리는 뒤에 추가만 되므로 발언자별로 이전에 만든 텍스트를 보관하고,
+        그 뒤에 새로 추가된 메시지만 이어 붙입니다. 요약으로 시작 위치가 앞으로
+        이동하면 보관한 텍스트의 앞부분만 잘라내므로 라운드가 바뀌어도 재사용됩니다.
+
+        Args:
+            debate_setup: 토론 설정
+            history: 대화 히스토리
+            speaker_idx: 발언자 인덱스 (자신의 발언은 "나"로 표시)
+            start: 포함할 첫 메시지 위치
+
+        Returns:
+            히스토리 텍스트
+        """
+        # 다른 토론의 히스토리가 들어오면 캐시 초기화
+        if history is not self._history_owner:
+            self._history_cache.clear()
+            self._history_owner = history
+
+        cached_start, end, text, offsets = self._history_cache.get(
+            speaker_idx, (start, start, "", [])
+        )
+        if not cached_start <= start <= end <= len(history):
+            # 시작 위치가 뒤로 가거나 히스토리가 줄어들었으면 처음부터 다시 생성
+            cached_start, end, text, offsets = start, start, "", []
+        elif start > cached_start:
+            # 요약에 포함된 앞부분 메시지만 잘라냄
+            dropped = start - cached_start
+            cut = offsets[dropped] if dropped < len(offsets) else len(text)
+            text = text[cut:]
+            offsets = [offset - cut for offset in offsets[dropped:]]
+
+        if end < len(history):
+            parts = [text]
+            length = len(text)
+            for msg in history[end:]:
+                if msg.speaker_idx == speaker_idx:
                     speaker_label = "나"
                 else:
-                    other_stance = debate_setup.stances[msg['speaker_idx']]
+                    other_stance = debate_setup.stances[msg.speaker_idx]
                     speaker_label = other_stance.title
-                prompt += f"{speaker_label}: {msg['content']}\n\n"
+                line = f"{speaker_label}: {msg.content}\n\n"
+                offsets.append(length)
+                length += len(line)
+                parts.append(line)
+            text = "".join(parts)
+            end = len(history)
+
+        self._history_cache[speaker_idx] = (start, end, text, offsets)
+        return text
+
+    def generate_history_summary_prompt(
+        self,
+        debate_setup: DebateSetup,
+        previous_summary: str,
+        messages: List[Turn]
+    ) -> str:
+        """이전 토론 요약 프롬프트
+
+        Args:
+            debate_setup: 토론 설정
+            previous_summary: 기존 요약 (없으면 빈 문자열)
+            messages: 새로 요약에 포함할 메시지 목록
+
+        Returns:
+            프롬프트 텍스트
+        """
+        parts = [f"다음은 \"{debate_setup.topic}\" 주제에 대한 토론의 앞부분입니다.\n\n"]
+
+        if previous_summary:
+            parts.append(f"[기존 요약]\n{previous_summary}\n\n[이어진 토론]\n")
+
+        for msg in messages:
+            stance = debate_setup.stances[msg.speaker_idx]
+            parts.append(f"{stance.title}: {msg.content}\n\n")
 
-        return prompt
+        parts.append(f"""위 내용을 다음 라운드 참여자들이 참고할 수 있도록 요약해주세요.
+
+요구사항:
+- 참여자별 핵심 주장과 근거를 빠짐없이 포함
+- 제기된 반박과 그에 대한 응답
+- 이미 인정되거나 합의된 사항과 남은 쟁점
+- {debate_setup.char_limit * 2}자 이내
+
+요약만 출력하세요 (다른 설명 없이).""")
+
+        return "".join(parts)
+
+    def generate_consensus_preamble(
+        self,
+        debate_setup: DebateSetup,
+        speaker_idx: int
+    ) -> str:
+        """합의 준비 확인 프롬프트의 고정 머리말 생성
+
+        Args:
+            debate_setup: 토론 설정
+            speaker_idx: 발언자 인덱스
+
+        Returns:
+            머리말 텍스트
+        """
+        stance = debate_setup.stances[speaker_idx]
+
+        return f"""당신은 "{stance.title}"입니다.
+
+토론 주제: {debate_setup.topic}
+당신의 입장: {stance.position}
+
+다른 참여자들의 최근 발언:
+"""
 
     def generate_consensus_check_prompt(
         self,
         debate_setup: DebateSetup,
         speaker_idx: int,
-        history: List[Dict]
+        history: List[Turn],
+        preamble: Optional[str] = None
     ) -> str:
         """합의 준비 확인 프롬프트
 
@@ -131,30 +287,26 @@ class PromptGenerator:
             debate_setup: 토론 설정
             speaker_idx: 발언자 인덱스
             history: 대화 히스토리
+            preamble: 미리 생성한 고정 머리말 (None이면 새로 생성)
 
         Returns:
             프롬프트 텍스트
         """
-        stance = debate_setup.stances[speaker_idx]
+        if preamble is None:
+            preamble = self.generate_consensus_preamble(debate_setup, speaker_idx)
 
         # 다른 참여자들의 최근 발언 정리
         recent_messages = history[-len(debate_setup.stances):] if len(history) >= len(debate_setup.stances) else history
 
         other_positions = []
         for msg in recent_messages:
-            if msg['speaker_idx'] != speaker_idx:
-                other_stance = debate_setup.stances[msg['speaker_idx']]
-                other_positions.append(f"{other_stance.title}: {msg['content'][:200]}...")
+            if msg.speaker_idx != speaker_idx:
+                other_stance = debate_setup.stances[msg.speaker_idx]
+                other_positions.append(f"{other_stance.title}: {msg.content[:200]}...")
 
         other_positions_text = "\n\n".join(other_positions)
 
-        return f"""당신은 "{stance.title}"입니다.
-
-토론 주제: {debate_setup.topic}
-당신의 입장: {stance.position}
-
-다른 참여자들의 최근 발언:
-{other_positions_text}
+        return f"""{preamble}{other_positions_text}
 
 질문: 이제 최종 합의안을 도출할 준비가 되셨습니까?
 
@@ -163,10 +315,68 @@ class PromptGenerator:
 
 **중요**: 'YES' 또는 'NO' 중 하나만 정확히 답변하세요. 다른 설명은 필요 없습니다."""
 
+    def generate_batch_consensus_prompt(
+        self,
+        debate_setup: DebateSetup,
+        history: List[Turn],
+        target_indices: Optional[List[int]] = None
+    ) -> str:
+        """여러 참여자 합의 준비 일괄 확인 프롬프트
+
+        Args:
+            debate_setup: 토론 설정
+            history: 대화 히스토리
+            target_indices: 판단할 참여자 인덱스 (None이면 전체)
+
+        Returns:
+            프롬프트 텍스트
+        """
+        num_participants = len(debate_setup.stances)
+        if target_indices is None:
+            target_indices = list(range(num_participants))
+        num_targets = len(target_indices)
+
+        stances_text = "\n".join(
+            f"{i+1}. {s.title}: {s.position}"
+            for i, s in enumerate(debate_setup.stances)
+        )
+
+        # 최근 한 라운드 분량의 발언만 전달
+        recent_messages = history[-num_participants:]
+        recent_text = "\n\n".join(
+            f"{debate_setup.stances[msg.speaker_idx].title}: {msg.content[:200]}..."
+            for msg in recent_messages
+        )
+
+        targets_text = ", ".join(
+            f"{idx+1}. {debate_setup.stances[idx].title}" for idx in target_indices
+        )
+        example = ", ".join(
+            '"YES"' if i % 2 == 0 else '"NO"' for i in range(num_targets)
+        )
+
+        return f"""다음은 "{debate_setup.topic}" 주제에 대한 토론입니다.
+
+참여자:
+{stances_text}
+
+최근 발언:
+{recent_text}
+
+질문: 다음 참여자가 각각 이제 최종 합의안을 도출할 준비가 되었는지 판단해주세요.
+대상: {targets_text}
+
+- YES: 충분히 토론했고, 합의점을 찾을 수 있다고 판단되면
+- NO: 아직 더 논의가 필요하거나, 상대의 주장에 반박할 점이 남아있으면
+
+**중요**: 대상 순서대로 {num_targets}개의 "YES" 또는 "NO"를 담은 JSON 배열만 답변하세요.
+예시: [{example}]
+다른 설명은 필요 없습니다."""
+
     def generate_synthesis_prompt(
         self,
         debate_setup: DebateSetup,
-        final_proposals: List[Dict]
+        final_proposals: List[Turn]
     ) -> str:
         """최종 결론 종합 프롬프트
 
@@ -178,11 +388,10 @@ class PromptGenerator:
             프롬프트 텍스트
         """
         # 각 참여자의 합의안 정리
-        proposals_text = ""
-        for msg in final_proposals:
-            speaker_idx = msg['speaker_idx']
-            stance = debate_setup.stances[speaker_idx]
-            proposals_text += f"\n[{stance.title}의 제안]\n{msg['content']}\n"
+        proposals_text = "".join(
+            f"\n[{debate_setup.stances[msg.speaker_idx].title}의 제안]\n{msg.content}\n"
+            for msg in final_proposals
+        )
 
         return f"""다음은 "{debate_setup.topic}" 주제에 대한 {len(debate_setup.stances)}명의 참여자들이 토론 후 제시한 최종 합의안입니다.
 
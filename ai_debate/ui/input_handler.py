@@ -1,10 +1,13 @@
 """사용자 입력 처리"""
 
-from typing import Dict
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
 from ai_debate.models.ai_model import AIModel
 from ai_debate.models.debate_setup import Stance, DebateSetup
 from ai_debate.services.ai_client import AIClient
 from ai_debate.services.prompt_generator import PromptGenerator
+from ai_debate.io.keyword_cache import KeywordCache
 from ai_debate.config.constants import (
     DEFAULT_CHAR_LIMIT,
     DEFAULT_NUM_ROUNDS,
@@ -16,6 +19,18 @@ from ai_debate.config.constants import (
 )
 from ai_debate.exceptions import InvalidInputError
 
+# 찬반 구분용 키워드 (키워드별로 따로 찾지 않고 패턴 하나로 한 번에 검색)
+_DISAGREE_RE = re.compile("반대|거부|부정|문제")
+_AGREE_RE = re.compile("찬성|긍정|동의|지지")
+
+# 콘솔 구분선
+_BANNER = "=" * 60
+
+# 입력 프롬프트 템플릿 (상수 부분은 임포트 시 한 번만 포맷)
+_PARTICIPANTS_PROMPT = f"토론 참여자 수 [기본: {{default}}, 최소: {MIN_PARTICIPANTS}, 최대: {MAX_PARTICIPANTS}]: "
+_CHAR_LIMIT_PROMPT = "답변 글자 수 제한 [기본: {default}]: "
+_ROUNDS_PROMPT = "최대 토론 라운드 횟수 [기본: {default}]: "
+
 
 class InputHandler:
     """사용자 입력 처리 클래스"""
@@ -44,82 +59,135 @@ class InputHandler:
 
     def get_num_participants(
         self,
-        default: int = DEFAULT_NUM_PARTICIPANTS
+        default: int = DEFAULT_NUM_PARTICIPANTS,
+        preset: Optional[int] = None
     ) -> int:
         """참여자 수 입력
 
         Args:
             default: 기본값
+            preset: 명령줄 인자로 받은 값 (지정되면 입력을 묻지 않음)
 
         Returns:
             참여자 수
         """
-        prompt = f"토론 참여자 수 [기본: {default}, 최소: {MIN_PARTICIPANTS}, 최대: {MAX_PARTICIPANTS}]: "
-        input_str = input(prompt).strip()
+        if preset is not None:
+            return self._clamp(preset, MIN_PARTICIPANTS, MAX_PARTICIPANTS)
 
-        if not input_str:
-            return default
-
-        try:
-            num = int(input_str)
-            if num < MIN_PARTICIPANTS:
-                print(f"⚠️  참여자 수는 최소 {MIN_PARTICIPANTS}명 이상이어야 합니다. 기본값({default}) 사용")
-                return default
-            elif num > MAX_PARTICIPANTS:
-                print(f"⚠️  참여자 수는 최대 {MAX_PARTICIPANTS}명까지 가능합니다. {MAX_PARTICIPANTS}명으로 설정")
-                return MAX_PARTICIPANTS
-            return num
-        except ValueError:
-            print(f"⚠️  올바른 숫자를 입력하세요. 기본값({default}) 사용")
-            return default
+        return self._parse_bounded_int(
+            input(_PARTICIPANTS_PROMPT.format(default=default)), default, MIN_PARTICIPANTS, MAX_PARTICIPANTS
+        )
 
-    def get_char_limit(self, default: int = DEFAULT_CHAR_LIMIT) -> int:
+    def get_char_limit(
+        self,
+        default: int = DEFAULT_CHAR_LIMIT,
+        preset: Optional[int] = None
+    ) -> int:
         """글자 수 제한 입력
 
         Args:
             default: 기본값
+            preset: 명령줄 인자로 받은 값 (지정되면 입력을 묻지 않음)
 
         Returns:
             글자 수 제한
         """
-        input_str = input(f"답변 글자 수 제한 [기본: {default}]: ").strip()
+        if preset is not None:
+            return self._clamp(preset, 1)
 
-        if not input_str:
-            return default
-
-        try:
-            return int(input_str)
-        except ValueError:
-            print(f"⚠️  올바른 숫자를 입력하세요. 기본값({default}) 사용")
-            return default
+        return self._parse_bounded_int(
+            input(_CHAR_LIMIT_PROMPT.format(default=default)), default, 1
+        )
 
     def get_num_rounds(
         self,
-        default: int = DEFAULT_NUM_ROUNDS
+        default: int = DEFAULT_NUM_ROUNDS,
+        preset: Optional[int] = None
     ) -> int:
         """라운드 수 입력
 
         Args:
             default: 기본값
+            preset: 명령줄 인자로 받은 값 (지정되면 입력을 묻지 않음)
 
         Returns:
             라운드 수
         """
-        input_str = input(f"최대 토론 라운드 횟수 [기본: {default}]: ").strip()
+        if preset is not None:
+            return self._clamp(preset, MIN_ROUNDS)
+
+        return self._parse_bounded_int(
+            input(_ROUNDS_PROMPT.format(default=default)), default, MIN_ROUNDS
+        )
+
+    @staticmethod
+    def _parse_bounded_int(
+        raw: str,
+        default: int,
+        lo: int,
+        hi: Optional[int] = None
+    ) -> int:
+        """정수 입력을 파싱하고 허용 범위로 맞춤 (내부 메서드)
+
+        Args:
+            raw: 사용자 입력 문자열
+            default: 빈 입력 또는 숫자가 아닐 때 사용할 기본값
+            lo: 최솟값
+            hi: 최댓값 (None이면 상한 없음)
 
-        if not input_str:
+        Returns:
+            범위 내로 조정된 정수
+        """
+        raw = raw.strip()
+        if not raw:
             return default
 
-        try:
-            num = int(input_str)
-            if num < MIN_ROUNDS:
-                print(f"⚠️  최소 {MIN_ROUNDS}라운드 이상 필요합니다. {MIN_ROUNDS}로 설정")
-                return MIN_ROUNDS
-            return num
-        except ValueError:
+        # 예외 대신 문자 검사로 잘못된 입력을 걸러냄
+        # (isdigit는 '²' 같은 문자도 통과시키므로 int()와 기준이 같은 isdecimal 사용)
+        digits = raw[1:] if raw[0] in '+-' else raw
+        if not digits.isdecimal():
             print(f"⚠️  올바른 숫자를 입력하세요. 기본값({default}) 사용")
             return default
 
+        return InputHandler._clamp(int(raw), lo, hi)
+
+    @staticmethod
+    def _clamp(value: int, lo: int, hi: Optional[int] = None) -> int:
+        """정수를 허용 범위로 맞춤 (내부 메서드)
+
+        Args:
+            value: 입력 값
+            lo: 최솟값
+            hi: 최댓값 (None이면 상한 없음)
+
+        Returns:
+            범위 내로 조정된 정수
+        """
+        bounded = max(lo, value if hi is None else min(hi, value))
+        if bounded != value:
+            print(f"⚠️  허용 범위를 벗어난 값입니다. {bounded}(으)로 설정")
+        return bounded
+
+    def confirm_resume(self, debate_setup: DebateSetup) -> bool:
+        """중단된 토론을 이어서 진행할지 확인
+
+        Args:
+            debate_setup: 저널에서 복원한 토론 설정
+
+        Returns:
+            이어서 진행하면 True
+        """
+        titles = ', '.join(f"{s.emoji} {s.title}" for s in debate_setup.stances)
+        print(f"\n♻️  같은 주제로 중단된 토론이 있습니다: {titles}")
+        print(
+            f"   이어서 진행하면 저장된 설정을 사용합니다: "
+            f"참여자={len(debate_setup.stances)}명, "
+            f"글자 수 제한={debate_setup.char_limit}자, "
+            f"최대 라운드={debate_setup.num_rounds}회"
+        )
+        answer = input("이어서 진행할까요? (y/N, N이면 이전 저널 삭제): ").strip().lower()
+        return answer in ('y', 'yes', 'ㅛ')
+
     def get_stance_position(self, participant_num: int) -> str:
         """참여자 입장 입력
 
@@ -144,20 +212,24 @@ class InputHandler:
 
         Args:
             available_models: 사용 가능한 AI 모델 딕셔너리
-            stance_title: 참여자 제목
+            stance_title: 메뉴에 표시할 참여자 이름
 
         Returns:
             선택된 AI 모델
         """
-        print(f"\n{'='*60}")
-        print(f"🤖 {stance_title}의 AI 선택")
-        print(f"{'='*60}\n")
+        # 선택지가 하나뿐이면 묻지 않고 바로 사용
+        if len(available_models) == 1:
+            only_model = next(iter(available_models.values()))
+            print(f"✅ {stance_title}: {only_model.display_name} 자동 선택\n")
+            return only_model
 
-        models = list(available_models.keys())
-        for i, key in enumerate(models, 1):
-            model = available_models[key]
-            print(f"{i}. {model.display_name}")
+        print("\n" + _BANNER)
+        print(f"🤖 {stance_title}의 AI 선택")
+        print(_BANNER + "\n")
 
+        # 표시 순서대로 한 번만 나열해 두고 출력과 선택에 재사용
+        models = tuple(available_models.values())
+        print("\n".join(f"{i}. {model.display_name}" for i, model in enumerate(models, 1)))
         print()
 
         while True:
@@ -169,8 +241,7 @@ class InputHandler:
 
                 choice_num = int(choice)
                 if 1 <= choice_num <= len(models):
-                    selected_key = models[choice_num - 1]
-                    selected_model = available_models[selected_key]
+                    selected_model = models[choice_num - 1]
                     print(f"✅ {selected_model.display_name} 선택됨\n")
                     return selected_model
                 else:
@@ -179,7 +250,7 @@ class InputHandler:
                 print(f"❌ 올바른 숫자를 입력하세요.")
             except KeyboardInterrupt:
                 print("\n\n⚠️  기본값 사용")
-                return list(available_models.values())[0]
+                return models[0]
 
     def create_stances_from_user_input(
         self,
@@ -187,7 +258,8 @@ class InputHandler:
         num_participants: int,
         available_models: Dict[str, AIModel],
         ai_client: AIClient,
-        prompt_generator: PromptGenerator
+        prompt_generator: PromptGenerator,
+        keyword_cache: Optional[KeywordCache] = None
     ) -> list[Stance]:
         """사용자 입력으로 참여자 입장 생성
 
@@ -197,6 +269,7 @@ class InputHandler:
             available_models: 사용 가능한 AI 모델
             ai_client: AI 클라이언트
             prompt_generator: 프롬프트 생성기
+            keyword_cache: 제목 캐시 (None이면 항상 AI로 생성)
 
         Returns:
             참여자 입장 리스트
@@ -205,32 +278,62 @@ class InputHandler:
         print("\n💡 역할/제목은 자동으로 생성됩니다.\n")
 
         stances = []
+        # 제목 생성에는 첫 번째 사용 가능한 모델 사용
+        title_model = next(iter(available_models.values()))
 
+        # 1단계: 모든 참여자의 핵심 주장 또는 역할 입력
+        positions = []
         for i in range(num_participants):
-            print(f"{'='*60}")
+            print(_BANNER)
             print(f"📍 참여자 {i+1}/{num_participants}")
-            print(f"{'='*60}")
-
-            # 핵심 주장 또는 역할 입력
-            position = self.get_stance_position(i + 1)
-
-            # 제목 자동 생성
-            print("\n🤖 제목 생성 중...")
-            title = self._generate_title(
-                topic,
-                position,
-                ai_client,
-                prompt_generator,
-                list(available_models.values())[0]
-            )
-            print(f"✅ 제목: {title}\n")
-
-            # AI 모델 선택
-            ai_model = self.select_model(available_models, title)
-
-            # 이모지 할당
-            emoji = STANCE_EMOJIS[i % len(STANCE_EMOJIS)]
-
+            print(_BANNER)
+            positions.append(self.get_stance_position(i + 1))
+
+        # 2단계: 제목 자동 생성을 백그라운드로 시작 (참여자별 호출은 서로 독립적이므로 병렬)
+        # 같은 주장은 한 번만 생성 (병렬 호출 중에는 제목 캐시가 중복을 막지 못함)
+        print("\n🤖 제목 생성 중 (백그라운드)...")
+        unique_positions = list(dict.fromkeys(positions))
+        executor = ThreadPoolExecutor(max_workers=len(unique_positions))
+        try:
+            title_futures = {
+                position: executor.submit(
+                    self._generate_title,
+                    topic,
+                    position,
+                    ai_client,
+                    prompt_generator,
+                    title_model,
+                    keyword_cache
+                )
+                for position in unique_positions
+            }
+
+            # 3단계: 제목을 기다리는 동안 참여자별 AI 모델 선택
+            models = [
+                self.select_model(available_models, f"참여자 {i+1}")
+                for i in range(num_participants)
+            ]
+
+            # 실패 메시지는 모델 선택 메뉴 중간에 끼지 않도록 모든 선택이 끝난 뒤 출력
+            title_by_position = {}
+            for position, future in title_futures.items():
+                try:
+                    title_by_position[position] = future.result()
+                except Exception as e:
+                    print(f"⚠️  제목 생성 실패: {e}")
+                    title_by_position[position] = "참여자"
+        except BaseException:
+            # 입력 중단(Ctrl+C, EOF) 시 진행 중인 제목 생성을 기다리지 않음
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
+        titles = [title_by_position[position] for position in positions]
+
+        # 4단계: 참여자 입장 생성 (이모지는 순서대로 미리 할당)
+        emojis = [STANCE_EMOJIS[i % len(STANCE_EMOJIS)] for i in range(num_participants)]
+        for i, (position, title, emoji, ai_model) in enumerate(
+            zip(positions, titles, emojis, models)
+        ):
             # Stance 생성
             stance = Stance(
                 title=title,
@@ -241,7 +344,8 @@ class InputHandler:
             )
             stances.append(stance)
 
-            print(f"✅ 참여자 {i+1} 설정 완료: {emoji} {title} ({ai_model.display_name})\n")
+            print(f"✅ 참여자 {i+1} 설정 완료: {emoji} {title} ({ai_model.display_name})")
+        print()
 
         # 발언 순서 최적화 (반대 입장자 우선)
         stances = self._optimize_speaker_order(stances)
@@ -254,7 +358,8 @@ class InputHandler:
         position: str,
         ai_client: AIClient,
         prompt_generator: PromptGenerator,
-        model: AIModel
+        model: AIModel,
+        keyword_cache: Optional[KeywordCache] = None
     ) -> str:
         """제목 생성 (내부 메서드)
 
@@ -264,19 +369,30 @@ class InputHandler:
             ai_client: AI 클라이언트
             prompt_generator: 프롬프트 생성기
             model: 사용할 AI 모델
+            keyword_cache: 제목 캐시 (None이면 항상 AI로 생성)
 
         Returns:
-            생성된 제목
+            생성된 제목 (응답이 비어 있으면 "참여자")
+
+        Raises:
+            AIModelNotFoundError, AITimeoutError, AIResponseError: AI 호출 실패 시
         """
+        if keyword_cache is not None:
+            cached = keyword_cache.get_title(topic, position)
+            if cached:
+                return cached
+
         prompt = prompt_generator.generate_title_prompt(topic, position)
 
-        try:
-            title = ai_client.call_ai(prompt, model)
-            # 너무 긴 제목은 잘라냄
-            return title[:30]
-        except Exception as e:
-            print(f"⚠️  제목 생성 실패: {e}")
-            return f"참여자"
+        # 설명이 덧붙은 응답은 첫 줄만 쓰고, 따옴표를 벗긴 뒤 너무 긴 제목은 잘라냄
+        # (병렬 실행되므로 실패는 출력하지 않고 호출한 쪽에 전달)
+        response = ai_client.call_ai(prompt, model).strip()
+        title = response.partition('\n')[0].strip().strip('"\'')[:30]
+        if not title:
+            return "참여자"
+        if keyword_cache is not None:
+            keyword_cache.set_title(topic, position, title)
+        return title
 
     def _optimize_speaker_order(self, stances: list[Stance]) -> list[Stance]:
         """발언 순서 최적화 (반대 입장자 우선)
@@ -293,11 +409,11 @@ class InputHandler:
         neutral = []
 
         for stance in stances:
-            position_lower = stance.position.lower()
-            if any(word in position_lower for word in ["반대", "거부", "부정", "문제"]):
+            # 반대 키워드가 하나라도 있으면 찬성 키워드보다 우선
+            if _DISAGREE_RE.search(stance.position):
                 stance.agree_or_disagree = "반대"
                 disagree.append(stance)
-            elif any(word in position_lower for word in ["찬성", "긍정", "동의", "지지"]):
+            elif _AGREE_RE.search(stance.position):
                 stance.agree_or_disagree = "찬성"
                 agree.append(stance)
             else:
@@ -1,8 +1,12 @@
 """AI 토론 시스템 진입점"""
 
+import argparse
+import os
+import re
 import sys
-from pathlib import Path
+from typing import List, Optional
 
+from ai_debate.models.ai_model import AIModel
 from ai_debate.models.debate_setup import DebateSetup
 from ai_debate.services.model_manager import ModelManager
 from ai_debate.services.ai_client import AIClient
@@ -10,17 +14,83 @@ from ai_debate.services.prompt_generator import PromptGenerator
 from ai_debate.services.debate_engine import DebateEngine
 from ai_debate.io.file_manager import FileManager
 from ai_debate.io.cache_manager import CacheManager
+from ai_debate.io.keyword_cache import KeywordCache
+from ai_debate.io.response_cache import ResponseCache
 from ai_debate.ui.console import Console
 from ai_debate.ui.input_handler import InputHandler
-from ai_debate.config.constants import CACHE_FILE
+from ai_debate.config.constants import CACHE_FILE, RESPONSE_CACHE_ENV
 from ai_debate.exceptions import (
     AIDebateException,
     NoAvailableModelsError
 )
 
+# 모델 응답의 마크다운 코드블록 본문 추출 (언어 태그 무관, 닫는 펜스 누락 허용)
+_CODE_BLOCK_RE = re.compile(r'```(?:[\w+-]*[ \t]*\n)?(.*?)(?:```|\Z)', re.DOTALL)
+
+# 파일명 키워드 정제용 정규식
+_FILENAME_STRIP_RE = re.compile(r'[^\w\-]')
+_DASH_COLLAPSE_RE = re.compile(r'\-+')
+
+
+def generate_subject_slug(
+    topic: str,
+    ai_client: AIClient,
+    prompt_generator: PromptGenerator,
+    ai_model: AIModel
+) -> str:
+    """AI로 파일명 키워드 생성 후 파일명에 안전한 형태로 정제
+
+    Args:
+        topic: 토론 주제
+        ai_client: AI 클라이언트
+        prompt_generator: 프롬프트 생성기
+        ai_model: 사용할 AI 모델
+
+    Returns:
+        파일명 키워드 (정제 결과가 비었거나 너무 길면 "debate")
+    """
+    keyword_prompt = prompt_generator.generate_filename_keyword_prompt(topic)
+    subject_slug = ai_client.call_ai(keyword_prompt, ai_model)
+
+    # 마크다운 코드블록 제거
+    block_match = _CODE_BLOCK_RE.search(subject_slug)
+    if block_match:
+        subject_slug = block_match.group(1).strip()
+
+    # 특수문자 제거 (앞뒤 공백과 따옴표도 여기서 함께 제거됨)
+    subject_slug = _FILENAME_STRIP_RE.sub('', subject_slug.lower())
+    subject_slug = _DASH_COLLAPSE_RE.sub('-', subject_slug).strip('-')
+    if not subject_slug or len(subject_slug) > 50:
+        subject_slug = "debate"
+
+    return subject_slug
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """명령줄 인자 파싱
+
+    설정값을 인자로 주면 해당 항목은 입력을 묻지 않습니다.
+
+    Args:
+        argv: 인자 목록 (None이면 sys.argv 사용)
+
+    Returns:
+        파싱된 인자
+    """
+    parser = argparse.ArgumentParser(
+        description="여러 AI 모델이 상반된 입장으로 토론하고 합의점을 찾습니다."
+    )
+    parser.add_argument("topic", nargs="?", help="토론 주제 (생략하면 입력을 받음)")
+    parser.add_argument("--participants", type=int, help="토론 참여자 수")
+    parser.add_argument("--char-limit", type=int, help="답변 글자 수 제한")
+    parser.add_argument("--rounds", type=int, help="최대 토론 라운드 횟수")
+    return parser.parse_args(argv)
+
 
 def main():
     """메인 함수"""
+    args = parse_args()
+
     console = Console()
     console.print_header("🎯 AI 토론 시스템")
 
@@ -31,7 +101,11 @@ def main():
         # 의존성 초기화
         cache_manager = CacheManager(CACHE_FILE)
         model_manager = ModelManager(cache_manager)
-        ai_client = AIClient()
+        response_cache = (
+            ResponseCache() if os.environ.get(RESPONSE_CACHE_ENV) == "1" else None
+        )
+        keyword_cache = KeywordCache()
+        ai_client = AIClient(response_cache=response_cache)
         prompt_generator = PromptGenerator()
         file_manager = FileManager()
         debate_engine = DebateEngine(ai_client, prompt_generator, file_manager)
@@ -40,16 +114,35 @@ def main():
         # AI 모델 가용성 확인 및 초기화
         model_manager.initialize_models()
 
+        # 사용자 입력을 받는 동안 CLI 예열
+        model_manager.warmup_models()
+
+        # 토론 주제 입력
+        topic = input_handler.get_topic(args.topic)
+
+        # 같은 주제로 중단된 토론이 있으면 설정을 묻기 전에 이어하기 제안
+        # (이어서 진행하면 저널에 저장된 설정을 그대로 사용)
+        interrupted = file_manager.find_interrupted_debate(
+            topic,
+            model_manager.get_available_models()
+        )
+        if interrupted:
+            journal_path, debate_setup, subject_slug = interrupted
+            if input_handler.confirm_resume(debate_setup):
+                console.print_header("💬 토론 재개")
+                debate_engine.conduct_debate(debate_setup, subject_slug, journal_path)
+                console.print_success("토론이 완료되었습니다!")
+                return
+            # 이어가지 않으면 다음 실행에서 다시 묻지 않도록 저널 정리
+            file_manager.discard_interrupted_debate(journal_path)
+
         # 사용자 입력
         console.print_section("⚙️  토론 설정")
 
-        # 명령줄 인자로 주제 전달 가능
-        default_topic = sys.argv[1] if len(sys.argv) > 1 else None
-
-        # 설정 입력
-        num_participants = input_handler.get_num_participants()
-        char_limit = input_handler.get_char_limit()
-        num_rounds = input_handler.get_num_rounds()
+        # 설정 입력 (명령줄 인자로 지정한 항목은 묻지 않음)
+        num_participants = input_handler.get_num_participants(preset=args.participants)
+        char_limit = input_handler.get_char_limit(preset=args.char_limit)
+        num_rounds = input_handler.get_num_rounds(preset=args.rounds)
 
         console.print_success(
             f"설정 완료: 참여자={num_participants}명, "
@@ -58,16 +151,14 @@ def main():
         )
         console.print_info("모든 참여자가 합의하면 최대 라운드 전에 조기 종료될 수 있습니다.\n")
 
-        # 토론 주제 입력
-        topic = input_handler.get_topic(default_topic)
-
         # 참여자 입장 생성 (사용자 입력 기반)
         stances = input_handler.create_stances_from_user_input(
             topic,
             num_participants,
             model_manager.get_available_models(),
             ai_client,
-            prompt_generator
+            prompt_generator,
+            keyword_cache
         )
 
         # 토론 설정 객체 생성
@@ -78,22 +169,20 @@ def main():
             num_rounds=num_rounds
         )
 
-        # 파일명 키워드 생성
-        print("📝 파일명 키워드 생성 중...")
-        keyword_prompt = prompt_generator.generate_filename_keyword_prompt(topic)
-        subject_slug = ai_client.call_ai(keyword_prompt, stances[0].ai_model)
-
-        # JSON 파싱 (마크다운 코드블록 제거)
-        if "```" in subject_slug:
-            import re
-            json_match = re.search(r'```(?:json)?\s*\n?(.*?)\n?```', subject_slug, re.DOTALL)
-            if json_match:
-                subject_slug = json_match.group(1).strip()
-
-        # 특수문자 제거
-        subject_slug = subject_slug.strip().strip('"').strip("'")
-        if not subject_slug or len(subject_slug) > 50:
-            subject_slug = "debate"
+        # 파일명 키워드 생성 (같은 주제면 캐시 사용)
+        subject_slug = keyword_cache.get_keyword(topic)
+        if subject_slug:
+            print("📝 캐시된 파일명 키워드 사용")
+        else:
+            print("📝 파일명 키워드 생성 중...")
+            subject_slug = generate_subject_slug(
+                topic,
+                ai_client,
+                prompt_generator,
+                stances[0].ai_model
+            )
+            if subject_slug != "debate":
+                keyword_cache.set_keyword(topic, subject_slug)
 
         console.print_success(f"파일명: {subject_slug}-{{timestamp}}.md\n")
 